@@ -3,11 +3,42 @@ from flask_cors import CORS
 from main import execute
 import threading
 import os
-from datetime import datetime
-import zipfile
+from datetime import datetime, date
+from functools import lru_cache
 import json
+import queue
 import traceback
 import atexit
+import signal
+import time
+
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson for faster (de)serialization."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=str).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+except ImportError:
+    # Fall back to Flask's default JSON handling if orjson is unavailable
+    orjson = None
+    OrjsonProvider = None
+
+# Heavy/optional modules are imported once at startup so /test does not
+# pay the import machinery on every hit; fail soft if they are missing
+try:
+    import torch
+except Exception:
+    torch = None
+try:
+    import psutil
+except Exception:
+    psutil = None
 
 from utils.api.task_handler import TaskHandler
 from utils.api.auth_handler import AuthHandler
@@ -15,9 +46,15 @@ from utils.api.file_handler import FileHandler
 from utils.api.request_handler import RequestHandler
 from utils.api.logger_handler import LoggerHandler
 
-# Global flag to track if background threads are running
+# Application root for resolving relative task paths; computed once at
+# import so request handlers skip the abspath/dirname syscalls
+APP_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Global flag to track if background threads are running, guarded by a
+# lock so racing initializers cannot start duplicate threads
 background_threads_started = False
 background_threads = []
+_init_lock = threading.Lock()
 
 def create_app():
     """Create and configure the Flask application."""
@@ -25,13 +62,23 @@ def create_app():
     
     # Configure maximum file size (e.g., 5GB)
     app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024 * 1024  # 5GB in bytes
+
+    # Use orjson for request/response JSON when available (status polling
+    # hits these paths once per second per active task)
+    if OrjsonProvider is not None:
+        app.json = OrjsonProvider(app)
+
+    # Let the frontend proxy (nginx/Apache) serve downloads via sendfile(2)
+    # when deployed behind one (X-Sendfile / X-Accel-Redirect)
+    app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', 'false').lower() == 'true'
     
-    # Enable CORS for all origins
+    # Enable CORS for all origins. A single "*" string takes Flask-CORS's
+    # wildcard fast path instead of matching an origin list per request;
+    # the old list form allowed everything anyway since it included "*"
     CORS(app, resources={
         r"/*": {
-            "origins":  ["https://sightlinks.org/", "*"],  # Allow all origins
+            "origins": "*",
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-            "cors_allowed_origins": ["https://sightlinks.org/", "*"],
             "supports_credentials": True,
             "max_age": 86400  # Cache preflight requests for 24 hours
         }
@@ -59,8 +106,11 @@ def queue_processor_wrapper(task_handler, execute_wrapper):
 def start_background_threads():
     """Start background threads if not already running."""
     global background_threads_started
-    
-    if not background_threads_started:
+
+    with _init_lock:
+        if background_threads_started:
+            return
+
         logger_handler.log_system('Starting background threads')
         
         # Start cleanup thread
@@ -91,14 +141,20 @@ def shutdown_threads():
     
     if background_threads_started:
         logger_handler.log_system('Shutting down background threads')
-        
-        # Signal queue processor to stop
+
+        # Signal both loops to stop, then unblock the queue get
+        task_handler.shutdown_flag.set()
         task_handler.task_queue.put(None)
-        
-        # Wait for threads to finish
+
+        # Wait for threads to finish against one shared deadline, so
+        # shutdown takes at most 5s total rather than 5s per thread
+        deadline = time.monotonic() + 5.0
         for thread in background_threads:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             if thread.is_alive():
-                thread.join(timeout=5.0)
+                thread.join(timeout=remaining)
         
         background_threads_started = False
         logger_handler.log_system('Background threads stopped')
@@ -106,8 +162,41 @@ def shutdown_threads():
 # Register shutdown function
 atexit.register(shutdown_threads)
 
-# Start background threads when the app is created
-start_background_threads()
+def _handle_sigterm(signum, frame):
+    """Drain background threads on SIGTERM before exiting."""
+    shutdown_threads()
+    raise SystemExit(0)
+
+# Under gunicorn the threads are started per worker by the post_fork hook
+# in gunicorn.conf.py; starting them at import time would also run them in
+# a preloaded master and fork duplicates into every worker. gunicorn
+# installs its own signal handlers, so only take SIGTERM ourselves when
+# running standalone.
+if not os.environ.get('SERVER_SOFTWARE', '').startswith('gunicorn'):
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    start_background_threads()
+
+# /test is polled by uptime monitors, so the filesystem and CUDA checks
+# are cached for a few seconds instead of re-stat'ing on every hit
+_TEST_CACHE = {'t': 0.0, 'v': None}
+_TEST_CACHE_TTL = 5.0
+
+# Pre-formatted wall-clock timestamp, refreshed lazily at most once per
+# second; health-check responses do not need sub-second precision
+_TS_CACHE = {'t': 0.0, 'iso': ''}
+
+@lru_cache(maxsize=1)
+def _today_stamp(ordinal):
+    """Format today's YYYYMMDD once per day for download filenames."""
+    return date.fromordinal(ordinal).strftime("%Y%m%d")
+
+def _cached_isoformat():
+    """Return an ISO timestamp no more than one second stale."""
+    now = time.monotonic()
+    if now - _TS_CACHE['t'] >= 1.0:
+        _TS_CACHE['iso'] = datetime.now().isoformat()
+        _TS_CACHE['t'] = now
+    return _TS_CACHE['iso']
 
 @app.route('/test', methods=['GET', 'POST'])
 def test_api():
@@ -120,7 +209,7 @@ def test_api():
         server_info = {
             "status": "operational",
             "version": "1.0.0",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _cached_isoformat(),
             "endpoints": {
                 "test": "/test",
                 "predict": "/predict",
@@ -138,90 +227,242 @@ def test_api():
             # Test file upload if present
             if request.files:
                 files = request.files.getlist('file')
-                server_info["files"] = [
-                    {
-                        "filename": f.filename,
-                        "content_type": f.content_type,
-                        "size": len(f.read()) if f else 0
-                    } for f in files
-                ]
-        
-        # Test model paths
-        model_checks = {
-            "yolo_n": os.path.exists("models/yolo-n.pt"),
-            "yolo_s": os.path.exists("models/yolo-s.pt"),
-            "yolo_m": os.path.exists("models/yolo-m.pt"),
-            "mobilenet": os.path.exists("models/MobileNetV3_state_dict_big_train.pth"),
-            "vgg16": os.path.exists("models/VGG16_Full_State_Dict.pth")
-        }
-        server_info["models"] = model_checks
-        
-        # Test directory structure
-        dir_checks = {
-            "run_output": os.path.exists("run/output"),
-            "run_extract": os.path.exists("run/extract"),
-            "input": os.path.exists("input"),
-            "models": os.path.exists("models")
-        }
-        server_info["directories"] = dir_checks
+                server_info["files"] = []
+                for f in files:
+                    if f:
+                        # Prefer the size werkzeug parsed from the multipart
+                        # headers; fall back to seek/tell, which still never
+                        # copies the upload into memory just to measure it
+                        size = f.content_length or 0
+                        if not size:
+                            f.stream.seek(0, os.SEEK_END)
+                            size = f.stream.tell()
+                            f.stream.seek(0)
+                    else:
+                        size = 0
+                    server_info["files"].append({
+                        "filename": f.filename if f else None,
+                        "content_type": f.content_type if f else None,
+                        "size": size
+                    })
         
-        # Test CUDA availability
-        try:
-            import torch
-            server_info["cuda"] = {
-                "available": torch.cuda.is_available(),
-                "device_count": torch.cuda.device_count() if torch.cuda.is_available() else 0,
-                "device_name": torch.cuda.get_device_name(0) if torch.cuda.is_available() else None
+        # Model, directory and CUDA checks change rarely, so reuse the
+        # cached result while it is fresh
+        now = time.monotonic()
+        cached = _TEST_CACHE['v']
+        if cached is None or now - _TEST_CACHE['t'] >= _TEST_CACHE_TTL:
+            # Test model paths: one directory scan replaces a stat call
+            # per model file
+            try:
+                with os.scandir("models") as it:
+                    model_files = {entry.name for entry in it}
+            except OSError:
+                model_files = set()
+            model_checks = {
+                "yolo_n": "yolo-n.pt" in model_files,
+                "yolo_s": "yolo-s.pt" in model_files,
+                "yolo_m": "yolo-m.pt" in model_files,
+                "mobilenet": "MobileNetV3_state_dict_big_train.pth" in model_files,
+                "vgg16": "VGG16_Full_State_Dict.pth" in model_files
             }
-        except Exception as e:
-            server_info["cuda"] = {"error": str(e)}
-        
-        # System info
-        import psutil
-        server_info["system"] = {
-            "cpu_percent": psutil.cpu_percent(),
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_percent": psutil.disk_usage('/').percent
-        }
+
+            # Test directory structure with one listing per parent
+            try:
+                top_level = set(os.listdir('.'))
+            except OSError:
+                top_level = set()
+            try:
+                run_level = set(os.listdir('run'))
+            except OSError:
+                run_level = set()
+            dir_checks = {
+                "run_output": "output" in run_level,
+                "run_extract": "extract" in run_level,
+                "input": "input" in top_level,
+                "models": "models" in top_level
+            }
+
+            # Test CUDA availability
+            try:
+                if torch is None:
+                    raise RuntimeError("torch not available")
+                cuda_info = {
+                    "available": torch.cuda.is_available(),
+                    "device_count": torch.cuda.device_count() if torch.cuda.is_available() else 0,
+                    "device_name": torch.cuda.get_device_name(0) if torch.cuda.is_available() else None
+                }
+            except Exception as e:
+                cuda_info = {"error": str(e)}
+
+            cached = {
+                "models": model_checks,
+                "directories": dir_checks,
+                "cuda": cuda_info
+            }
+            _TEST_CACHE['v'] = cached
+            _TEST_CACHE['t'] = now
+
+        server_info["models"] = cached["models"]
+        server_info["directories"] = cached["directories"]
+        server_info["cuda"] = cached["cuda"]
+
+        # System info (interval=None makes cpu_percent non-blocking)
+        if psutil is not None:
+            server_info["system"] = {
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "memory_percent": psutil.virtual_memory().percent,
+                "disk_percent": psutil.disk_usage('/').percent
+            }
+        else:
+            server_info["system"] = {"error": "psutil not available"}
         
         return request_handler.create_success_response(server_info)
         
     except Exception as e:
-        logger_handler.log_error(str(e), details=traceback.format_exc())
+        logger_handler.log_error(str(e), details=_error_details())
         return request_handler.create_error_response(str(e), 500)
 
 
+def _error_details():
+    """Return traceback details for error logs.
+
+    format_exc() walks the stack and reads source files, which is wasted
+    work when the handler only logs the message, so the traceback is only
+    rendered when debug logging is on.
+    """
+    return traceback.format_exc() if logger_handler.is_debug_enabled() else None
+
+def _log_request_inspection(endpoint):
+    """Log full request details at debug level for upload endpoints."""
+    logger_handler.log_debug(f"========== DETAILED REQUEST INSPECTION ({endpoint}) ==========")
+    logger_handler.log_debug(f"Request method: {request.method}")
+    logger_handler.log_debug(f"Content-Type: {request.content_type}")
+    logger_handler.log_debug(f"Content-Length: {request.headers.get('Content-Length')}")
+    logger_handler.log_debug(f"Form keys: {list(request.form.keys())}")
+    logger_handler.log_debug(f"Files keys: {list(request.files.keys())}")
+
+    # Inspect each file key
+    for key in request.files:
+        files_list = request.files.getlist(key)
+        logger_handler.log_debug(f"File key '{key}' has {len(files_list)} file(s):")
+        for idx, file in enumerate(files_list):
+            if file and file.filename:
+                file.stream.seek(0, os.SEEK_END)
+                file_size = file.stream.tell()
+                file.stream.seek(0)  # Reset file pointer
+                logger_handler.log_debug(f"  [{idx}] {file.filename} ({file.content_type}), {file_size} bytes")
+            else:
+                logger_handler.log_debug(f"  [{idx}] Empty file")
+
+# How long the synchronous /predict endpoint waits for the pipeline
+# before giving up (seconds); keep it below the proxy/gunicorn timeout
+PREDICT_SYNC_TIMEOUT = int(os.environ.get('PREDICT_SYNC_TIMEOUT', 570))
+
+def _finish_predict_api(input_folder, params):
+    """Queue a /predict task, wait for it and build the response."""
+    # Fast-fail when the synchronous path is saturated rather than letting
+    # uploads accumulate unbounded
+    if not task_handler.sync_task_semaphore.acquire(blocking=False):
+        logger_handler.log_error('Server busy', details='Synchronous predict slots exhausted')
+        return request_handler.create_error_response('Server is busy. Please try again later.', 503)
+
+    try:
+        # Route through the same queue as /web/predict so the ML work runs
+        # on the pool workers; this thread just waits and keeps its siblings
+        # free to serve status polls and downloads
+        task_id = task_handler.add_task({
+            'status': 'queued',
+            'progress': 0,
+            'stage': 'Queued',
+            'created_at': datetime.now(),
+            'session_id': os.path.basename(input_folder),
+            'input_folder': input_folder
+        })
+        try:
+            task_handler.queue_task({
+                'id': task_id,
+                'input_folder': input_folder,
+                'params': params
+            })
+        except queue.Full:
+            logger_handler.log_error('Server busy', details='Queue filled while accepting task')
+            return request_handler.create_error_response('Server is busy. Please try again later.', 503)
+
+        task = task_handler.wait_for_task(task_id, timeout=PREDICT_SYNC_TIMEOUT)
+    finally:
+        task_handler.sync_task_semaphore.release()
+
+    if task is None:
+        error_msg = f"Task {task_id} did not finish within {PREDICT_SYNC_TIMEOUT}s; poll /web/status/{task_id} instead"
+        logger_handler.log_error(error_msg)
+        return request_handler.create_error_response(error_msg, 504)
+
+    logger_handler.log_task_status(task_id, task.get('status', 'unknown'), error=task.get('error'))
+
+    if task.get('status') == 'failed':
+        error_msg = task.get('error', 'Unknown error occurred')
+        logger_handler.log_error(error_msg)
+        return request_handler.create_error_response(error_msg, 500)
+
+    if not task.get('zip_path'):
+        error_msg = "No output file was generated"
+        logger_handler.log_error(error_msg)
+        return request_handler.create_error_response(error_msg, 500)
+
+    logger_handler.log_file_operation('SEND', task['zip_path'])
+
+    # Return response based on client preference
+    if request_handler.wants_json_response(request):
+        return request_handler.create_success_response({
+            'status': 'success',
+            'message': 'Processing completed',
+            'output_path': task['zip_path']
+        })
+    else:
+        # FIXED: Use direct send_file instead of file_handler to avoid double-wrapping
+        zip_path = task['zip_path']
+
+        # Fixed filename for consistency
+        timestamp = _today_stamp(date.today().toordinal())
+        filename = f"result_{timestamp}.zip"
+
+        # Use Flask's send_file directly; conditional=True enables
+        # ETag/Range support so clients can resume large downloads
+        return send_file(
+            zip_path,
+            mimetype='application/zip',
+            as_attachment=True,
+            download_name=filename,
+            conditional=True,
+            etag=True,
+            last_modified=os.path.getmtime(zip_path)
+        )
+
 @app.route('/predict', methods=['POST'])
 def predict_api():
     """Direct API endpoint that waits for completion"""
     try:
         logger_handler.log_request('POST', '/predict')
-        
-        # DEBUG - Log full request details
-        print("\n========== DETAILED REQUEST INSPECTION (/predict) ==========")
-        print(f"Request method: {request.method}")
-        print(f"Content-Type: {request.content_type}")
-        print(f"Content-Length: {request.headers.get('Content-Length')}")
-        print(f"Form keys: {list(request.form.keys())}")
-        print(f"Files keys: {list(request.files.keys())}")
-        
-        # Inspect each file key
-        for key in request.files:
-            files_list = request.files.getlist(key)
-            print(f"\nFile key '{key}' has {len(files_list)} file(s):")
-            for idx, file in enumerate(files_list):
-                if file and file.filename:
-                    print(f"  [{idx}] Filename: {file.filename}")
-                    print(f"      Content-Type: {file.content_type}")
-                    file_size = 0
-                    file.stream.seek(0, os.SEEK_END)
-                    file_size = file.stream.tell()
-                    file.stream.seek(0)  # Reset file pointer
-                    print(f"      Size: {file_size} bytes")
-                else:
-                    print(f"  [{idx}] Empty file")
-        print("===========================================================\n")
-        
+
+        # Fast path: raw uploads are streamed straight to disk, skipping the
+        # multipart parser entirely
+        if request.content_type and request.content_type.startswith('application/octet-stream'):
+            session_id, input_folder = file_handler.create_session_folders()
+            logger_handler.log_file_operation('CREATE_SESSION', input_folder)
+
+            filepaths = request_handler.save_uploaded_file_streaming(request, input_folder)
+            logger_handler.log_file_operation('SAVE', input_folder, details=f'{len(filepaths)} file(s)')
+
+            params = request_handler.parse_stream_parameters(request)
+            logger_handler.log_request('POST', '/predict', params=params)
+
+            return _finish_predict_api(input_folder, params)
+
+        # Full request details only when debug logging is on; the inspection
+        # (including per-file stream seeks) is skipped entirely otherwise
+        if logger_handler.is_debug_enabled():
+            _log_request_inspection('/predict')
+
         # Parse request
         files, params = request_handler.parse_request_parameters(request)
         logger_handler.log_request('POST', '/predict', params=params)
@@ -232,94 +473,98 @@ def predict_api():
         
         # Save files
         filepaths = request_handler.save_uploaded_files(files, input_folder)
-        for filepath in filepaths:
-            logger_handler.log_file_operation('SAVE', filepath)
-        
-        # Process directly
-        task_id = task_handler.process_task(None, input_folder, params, execute_wrapper)
-        
-        # Get task result
-        task = task_handler.get_task_status(task_id)
-        if task is None:
-            error_msg = f"Task {task_id} not found or failed to process"
-            logger_handler.log_error(error_msg)
-            return request_handler.create_error_response(error_msg, 500)
-        
-        logger_handler.log_task_status(task_id, task.get('status', 'unknown'), error=task.get('error'))
-        
-        if task.get('status') == 'failed':
-            error_msg = task.get('error', 'Unknown error occurred')
-            logger_handler.log_error(error_msg)
-            return request_handler.create_error_response(error_msg, 500)
-        
-        if not task.get('zip_path'):
-            error_msg = "No output file was generated"
-            logger_handler.log_error(error_msg)
-            return request_handler.create_error_response(error_msg, 500)
-        
-        logger_handler.log_file_operation('SEND', task['zip_path'])
-        
-        # Return response based on client preference
-        if request_handler.wants_json_response(request):
-            return request_handler.create_success_response({
-                'status': 'success',
-                'message': 'Processing completed',
-                'output_path': task['zip_path']
-            })
-        else:
-            # FIXED: Use direct send_file instead of file_handler to avoid double-wrapping
-            zip_path = task['zip_path']
-            
-            # Fixed filename for consistency
-            timestamp = datetime.now().strftime("%Y%m%d")
-            filename = f"result_{timestamp}.zip"
-            
-            # Use Flask's send_file directly
-            return send_file(
-                zip_path,
-                mimetype='application/zip',
-                as_attachment=True,
-                download_name=filename
-            )
-            
+        logger_handler.log_file_operation('SAVE', input_folder, details=f'{len(filepaths)} file(s)')
+
+        return _finish_predict_api(input_folder, params)
+
     except ValueError as ve:
         logger_handler.log_error(str(ve))
         return request_handler.create_error_response(str(ve), 400)
     except Exception as e:
-        logger_handler.log_error(str(e), details=traceback.format_exc())
+        logger_handler.log_error(str(e), details=_error_details())
         return request_handler.create_error_response(str(e), 500)
 
+def _queue_predict_web(session_id, input_folder, params):
+    """Create and queue a /web/predict task and build the response."""
+    # Create task
+    task_data = {
+        'status': 'queued',
+        'progress': 0,
+        'stage': 'Queued',
+        'created_at': datetime.now(),
+        'session_id': session_id,
+        'input_folder': input_folder
+    }
+    task_id = task_handler.add_task(task_data)
+    logger_handler.log_task_status(task_id, 'queued', progress=0, stage='Queued')
+
+    # Queue task; the enqueue itself is the authoritative capacity check,
+    # since the endpoint-level full() pre-checks can race
+    try:
+        task_handler.queue_task({
+            'id': task_id,
+            'input_folder': input_folder,
+            'params': params
+        })
+    except queue.Full:
+        logger_handler.log_error('Server busy', details='Queue filled while accepting task')
+        return request_handler.create_error_response('Server is busy. Please try again later.', 503)
+
+    return request_handler.create_success_response({
+        'task_id': task_id,
+        'message': 'Task queued successfully'
+    })
+
 @app.route('/web/predict', methods=['POST'])
 def predict_web():
     """Web endpoint with queuing and progress tracking"""
     try:
         logger_handler.log_request('POST', '/web/predict')
-        
-        # DEBUG - Log full request details
-        print("\n========== DETAILED REQUEST INSPECTION (/web/predict) ==========")
-        print(f"Request method: {request.method}")
-        print(f"Content-Type: {request.content_type}")
-        print(f"Content-Length: {request.headers.get('Content-Length')}")
-        print(f"Form keys: {list(request.form.keys())}")
-        print(f"Files keys: {list(request.files.keys())}")
-        
-        # Inspect each file key
-        for key in request.files:
-            files_list = request.files.getlist(key)
-            print(f"\nFile key '{key}' has {len(files_list)} file(s):")
-            for idx, file in enumerate(files_list):
-                if file and file.filename:
-                    print(f"  [{idx}] Filename: {file.filename}")
-                    print(f"      Content-Type: {file.content_type}")
-                    file_size = 0
-                    file.stream.seek(0, os.SEEK_END)
-                    file_size = file.stream.tell()
-                    file.stream.seek(0)  # Reset file pointer
-                    print(f"      Size: {file_size} bytes")
-                else:
-                    print(f"  [{idx}] Empty file")
-        print("===========================================================\n")
-        
+
+        # Direct-to-S3 flow: the client already uploaded via a pre-signed URL
+        # (see /web/presign) and posts the object key back
+        s3_bucket = os.environ.get('S3_UPLOAD_BUCKET')
+        if s3_bucket and request.is_json:
+            data = request.get_json(silent=True) or {}
+            if data.get('key'):
+                if task_handler.task_queue.full():
+                    logger_handler.log_error('Server busy', details='Queue is full')
+                    return request_handler.create_error_response('Server is busy. Please try again later.', 503)
+
+                session_id, input_folder = file_handler.create_session_folders()
+                logger_handler.log_file_operation('CREATE_SESSION', input_folder)
+
+                filepaths = request_handler.fetch_s3_upload(s3_bucket, data['key'], input_folder)
+                logger_handler.log_file_operation('SAVE', input_folder, details=f'{len(filepaths)} file(s)')
+
+                params = request_handler.build_params(data, str(data.get('input_type', '0')))
+                logger_handler.log_request('POST', '/web/predict', params=params)
+
+                return _queue_predict_web(session_id, input_folder, params)
+
+        # Fast path: raw uploads are streamed straight to disk, skipping the
+        # multipart parser entirely
+        if request.content_type and request.content_type.startswith('application/octet-stream'):
+            if task_handler.task_queue.full():
+                logger_handler.log_error('Server busy', details='Queue is full')
+                return request_handler.create_error_response('Server is busy. Please try again later.', 503)
+
+            session_id, input_folder = file_handler.create_session_folders()
+            logger_handler.log_file_operation('CREATE_SESSION', input_folder)
+
+            filepaths = request_handler.save_uploaded_file_streaming(request, input_folder)
+            logger_handler.log_file_operation('SAVE', input_folder, details=f'{len(filepaths)} file(s)')
+
+            params = request_handler.parse_stream_parameters(request)
+            logger_handler.log_request('POST', '/web/predict', params=params)
+
+            return _queue_predict_web(session_id, input_folder, params)
+
+        # Full request details only when debug logging is on; the inspection
+        # (including per-file stream seeks) is skipped entirely otherwise
+        if logger_handler.is_debug_enabled():
+            _log_request_inspection('/web/predict')
+
         # Parse request
         files, params = request_handler.parse_request_parameters(request)
         logger_handler.log_request('POST', '/web/predict', params=params)
@@ -335,41 +580,74 @@ def predict_web():
         
         # Save files
         filepaths = request_handler.save_uploaded_files(files, input_folder)
-        for filepath in filepaths:
-            logger_handler.log_file_operation('SAVE', filepath)
-        
-        # Create task
-        task_data = {
-            'status': 'queued',
-            'progress': 0,
-            'stage': 'Queued',
-            'created_at': datetime.now(),
-            'session_id': session_id,
-            'input_folder': input_folder
-        }
-        task_id = task_handler.add_task(task_data)
-        logger_handler.log_task_status(task_id, 'queued', progress=0, stage='Queued')
-        
-        # Queue task
-        task_handler.queue_task({
-            'id': task_id,
-            'input_folder': input_folder,
-            'params': params
-        })
-        
-        return request_handler.create_success_response({
-            'task_id': task_id,
-            'message': 'Task queued successfully'
-        })
-        
+        logger_handler.log_file_operation('SAVE', input_folder, details=f'{len(filepaths)} file(s)')
+
+        return _queue_predict_web(session_id, input_folder, params)
+
     except ValueError as ve:
         logger_handler.log_error(str(ve))
         return request_handler.create_error_response(str(ve), 400)
     except Exception as e:
-        logger_handler.log_error(str(e), details=traceback.format_exc())
+        logger_handler.log_error(str(e), details=_error_details())
         return request_handler.create_error_response(str(e), 500)
 
 
+@app.route('/web/presign', methods=['POST'])
+def presign_upload():
+    """Return a pre-signed S3 PUT URL for direct-to-S3 uploads."""
+    try:
+        logger_handler.log_request('POST', '/web/presign')
+
+        bucket = os.environ.get('S3_UPLOAD_BUCKET')
+        if not bucket:
+            return request_handler.create_error_response('Direct-to-S3 uploads are not configured', 501)
+
+        try:
+            import boto3
+        except ImportError:
+            logger_handler.log_error('boto3 not installed but S3_UPLOAD_BUCKET is set')
+            return request_handler.create_error_response('Direct-to-S3 uploads are not available', 501)
+
+        import uuid
+        key = f"uploads/{uuid.uuid4()}.zip"
+        url = boto3.client('s3').generate_presigned_url(
+            'put_object',
+            Params={'Bucket': bucket, 'Key': key},
+            ExpiresIn=3600
+        )
+
+        return request_handler.create_success_response({
+            'upload_url': url,
+            'key': key
+        })
+
+    except Exception as e:
+        logger_handler.log_error(str(e), details=_error_details())
+        return request_handler.create_error_response(str(e), 500)
+
+# Reuse a cached download token for at most half its lifetime, so a
+# completed task polled every few seconds does not pay for a fresh JWT
+# signature per poll while clients still always receive a token with
+# comfortable remaining validity
+_TOKEN_REUSE_SECONDS = auth_handler.MAX_TOKEN_AGE_HOURS * 3600 / 2
+
+
+def _download_token_for(task, task_id):
+    """Return a download token for the task, reusing a recent one if cached."""
+    token = task.get('download_token')
+    if token and time.time() - task.get('download_token_issued', 0) < _TOKEN_REUSE_SECONDS:
+        return token
+
+    token = auth_handler.generate_download_token(task['session_id'], task_id)
+    issued = time.time()
+    with task_handler.task_lock:
+        stored = task_handler.active_tasks.get(task_id)
+        if stored is not None:
+            stored['download_token'] = token
+            stored['download_token_issued'] = issued
+    return token
+
+
 @app.route('/web/status/<task_id>', methods=['GET'])
 def get_task_status(task_id):
     """Get task status and progress."""
@@ -387,15 +665,17 @@ def get_task_status(task_id):
             if 'has_detections' in task:
                 has_detections = task.get('has_detections', False)
                 total_detections = 0  # Will be determined if needed
-                
-                logger_handler.log_system(f'Using stored detection status: {has_detections}')
-                
+
+                # This branch runs on every browser poll, so keep it quiet
+                # at INFO level
+                if logger_handler.is_debug_enabled():
+                    logger_handler.log_debug(f'Using stored detection status: {has_detections}')
+
                 # If we have no detections, we're done
                 if not has_detections:
-                    logger_handler.log_system(f'Task {task_id} has no detections (from stored status)')
                     # Generate download token for accessing the no_detections.txt file
                     if task.get('session_id'):
-                        token = auth_handler.generate_download_token(task['session_id'], task_id)
+                        token = _download_token_for(task, task_id)
                         return request_handler.create_success_response({
                             'completed': True,
                             'download_token': token,
@@ -404,33 +684,12 @@ def get_task_status(task_id):
                 
                 # For tasks with detections, we need the download token
                 if task.get('session_id') and task.get('zip_path'):
-                    token = auth_handler.generate_download_token(task['session_id'], task_id)
-                    
-                    # Count detections if we need to
-                    if has_detections and 'total_detections' not in task:
-                        # We'll need to count the detections
-                        output_folder = task.get('output_folder')
-                        if not output_folder and task.get('zip_path'):
-                            output_folder = os.path.dirname(task.get('zip_path'))
-                            
-                        if output_folder and os.path.exists(output_folder):
-                            # Try to count from JSON first
-                            json_path = os.path.join(output_folder, "detections.json")
-                            if os.path.exists(json_path) and os.path.getsize(json_path) > 10:
-                                try:
-                                    with open(json_path, 'r') as f:
-                                        data = json.load(f)
-                                        for item in data:
-                                            coordinates = item.get('coordinates', [])
-                                            if isinstance(coordinates, list):
-                                                total_detections += len(coordinates)
-                                        logger_handler.log_system(f'Counted {total_detections} detections from JSON')
-                                except Exception as e:
-                                    logger_handler.log_error(f'Error reading JSON: {str(e)}')
-                    else:
-                        # Use already stored count
-                        total_detections = task.get('total_detections', 0)
-                        
+                    token = _download_token_for(task, task_id)
+
+                    # Detection counts are computed once at task completion
+                    # and cached on the task, so polls never touch the disk
+                    total_detections = task.get('total_detections', 0)
+
                     response_data = {
                         'completed': True,
                         'download_token': token,
@@ -448,7 +707,7 @@ def get_task_status(task_id):
             if task.get('zip_path'):
                 # Generate download token
                 if task.get('session_id'):
-                    token = auth_handler.generate_download_token(task['session_id'], task_id)
+                    token = _download_token_for(task, task_id)
                     
                     # Determine if the task has detections - improved path handling
                     zip_path = task.get('zip_path', '')
@@ -471,30 +730,36 @@ def get_task_status(task_id):
                         output_folder = session_output
                         logger_handler.log_system(f'Found output folder at session path: {output_folder}')
                     else:
-                        # Next, look for folders in the zip directory that might contain the detection files
+                        # Next, look for folders in the zip directory that might contain the detection files.
+                        # One scandir pass yields the directory flag and mtime
+                        # together, instead of an isdir + getmtime stat per entry
                         possible_folders = []
-                        if os.path.exists(zip_directory) and os.path.isdir(zip_directory):
-                            for item in os.listdir(zip_directory):
-                                item_path = os.path.join(zip_directory, item)
-                                if os.path.isdir(item_path):
-                                    possible_folders.append(item_path)
-                        
+                        try:
+                            with os.scandir(zip_directory) as entries:
+                                possible_folders = [
+                                    (entry.path, entry.stat(follow_symlinks=False).st_mtime)
+                                    for entry in entries
+                                    if entry.is_dir(follow_symlinks=False)
+                                ]
+                        except OSError:
+                            pass
+
                         if len(possible_folders) == 1:
                             # If there's only one folder, use it
-                            output_folder = possible_folders[0]
+                            output_folder = possible_folders[0][0]
                             logger_handler.log_system(f'Found single output folder: {output_folder}')
                         elif len(possible_folders) > 1:
                             # If there are multiple folders, try to find the one with detection files
-                            for folder in possible_folders:
+                            for folder, _ in possible_folders:
                                 if os.path.exists(os.path.join(folder, 'detections.json')):
                                     output_folder = folder
                                     logger_handler.log_system(f'Found output folder with JSON: {output_folder}')
                                     break
-                            
+
                             if not output_folder:
                                 # If still not found, use the most recently modified folder
-                                possible_folders.sort(key=os.path.getmtime, reverse=True)
-                                output_folder = possible_folders[0]
+                                possible_folders.sort(key=lambda item: item[1], reverse=True)
+                                output_folder = possible_folders[0][0]
                                 logger_handler.log_system(f'Using most recent folder: {output_folder}')
                     
                     # If we still don't have an output folder, just use the zip directory
@@ -514,47 +779,63 @@ def get_task_status(task_id):
                         if os.path.exists(json_path) and os.path.getsize(json_path) > 10:
                             try:
                                 logger_handler.log_system(f'Found JSON output file: {json_path} (size: {os.path.getsize(json_path)})')
-                                with open(json_path, 'r') as f:
-                                    data = json.load(f)
-                                    # Count detections across all images
-                                    for item in data:
-                                        coordinates = item.get('coordinates', [])
-                                        if isinstance(coordinates, list):
-                                            detection_count = len(coordinates)
-                                            total_detections += detection_count
-                                            image_name = item.get('image', 'unknown')
-                                            logger_handler.log_system(f'Image {image_name}: {detection_count} detections')
-                                    
-                                    # If we found any detections in the JSON, set flag to true
-                                    has_detections = total_detections > 0
-                                    logger_handler.log_system(f'Found {total_detections} total detections in JSON data')
+                                with open(json_path, 'rb') as f:
+                                    content = f.read()
+                                # orjson parses in C, several times faster
+                                # than the stdlib on large detection lists
+                                data = orjson.loads(content) if orjson is not None else json.loads(content)
+                                # Count detections across all images
+                                for item in data:
+                                    coordinates = item.get('coordinates', [])
+                                    if isinstance(coordinates, list):
+                                        detection_count = len(coordinates)
+                                        total_detections += detection_count
+                                        image_name = item.get('image', 'unknown')
+                                        logger_handler.log_system(f'Image {image_name}: {detection_count} detections')
+
+                                # If we found any detections in the JSON, set flag to true
+                                has_detections = total_detections > 0
+                                logger_handler.log_system(f'Found {total_detections} total detections in JSON data')
                             except Exception as e:
                                 logger_handler.log_error(f'Error reading JSON: {str(e)}')
                         
-                        # If no JSON or no detections found in JSON, check TXT files
+                        # If no JSON or no detections found in JSON, check TXT files.
+                        # One scandir pass filters by name and skips empty files
+                        # using the size stat the directory read already provides
                         if not has_detections and os.path.exists(output_folder):
-                            txt_files = [f for f in os.listdir(output_folder) if f.endswith('.txt') and f != "no_detections.txt"]
-                            
-                            if txt_files:
-                                logger_handler.log_system(f'Found {len(txt_files)} TXT files in output folder')
-                                for txt_file in txt_files:
-                                    txt_path = os.path.join(output_folder, txt_file)
-                                    # Count lines as detections
-                                    if os.path.getsize(txt_path) > 0:
-                                        try:
-                                            with open(txt_path, 'r') as f:
-                                                lines = [line.strip() for line in f if line.strip()]
-                                                file_detections = len(lines)
-                                                total_detections += file_detections
-                                                logger_handler.log_system(f'TXT file {txt_file}: {file_detections} detections')
-                                        except Exception as e:
-                                            logger_handler.log_error(f'Error reading TXT file: {str(e)}')
-                                
+                            try:
+                                with os.scandir(output_folder) as entries:
+                                    txt_paths = [entry.path for entry in entries
+                                                 if entry.name.endswith('.txt')
+                                                 and entry.name != "no_detections.txt"
+                                                 and entry.stat(follow_symlinks=False).st_size > 0]
+                            except OSError:
+                                txt_paths = []
+
+                            if txt_paths:
+                                logger_handler.log_system(f'Found {len(txt_paths)} TXT files in output folder')
+                                for txt_path in txt_paths:
+                                    # Count non-empty lines as detections
+                                    try:
+                                        with open(txt_path, 'rb') as f:
+                                            file_detections = sum(1 for line in f.read().split(b'\n') if line.strip())
+                                        total_detections += file_detections
+                                        logger_handler.log_system(f'TXT file {os.path.basename(txt_path)}: {file_detections} detections')
+                                    except Exception as e:
+                                        logger_handler.log_error(f'Error reading TXT file: {str(e)}')
+
                                 has_detections = total_detections > 0
                                 logger_handler.log_system(f'Found {total_detections} total detections in TXT files')
                     
                     logger_handler.log_system(f'Final detection status: has_detections={has_detections}, total_detections={total_detections}')
-                    
+
+                    # Cache the computed status on the task so later polls
+                    # take the in-memory branch instead of re-scanning disk
+                    with task_handler.task_lock:
+                        if task_id in task_handler.active_tasks:
+                            task_handler.active_tasks[task_id]['has_detections'] = has_detections
+                            task_handler.active_tasks[task_id]['total_detections'] = total_detections
+
                     response_data = {
                         'completed': True,
                         'download_token': token,
@@ -574,7 +855,7 @@ def get_task_status(task_id):
                 
                 # Generate download token for accessing the no_detections.txt file if needed
                 if task.get('session_id'):
-                    token = auth_handler.generate_download_token(task['session_id'], task_id)
+                    token = _download_token_for(task, task_id)
                     return request_handler.create_success_response({
                         'completed': True,
                         'download_token': token,
@@ -611,15 +892,17 @@ def get_task_status(task_id):
         })
         
     except Exception as e:
-        logger_handler.log_error(str(e), details=traceback.format_exc())
+        logger_handler.log_error(str(e), details=_error_details())
         return request_handler.create_error_response(str(e), 500)
 
 @app.route('/download/<token>', methods=['GET'])
 def download_result(token):
     """Download the result file using a valid token."""
     try:
-        logger_handler.log_request('GET', f'/download/{token}')
-        
+        # Log only a token prefix: the full token is a bearer credential and
+        # the full string is expensive to format on every poll
+        logger_handler.log_request('GET', f'/download/{token[:12]}...')
+
         # Verify token
         payload = auth_handler.verify_download_token(token)
         if not payload:
@@ -631,13 +914,13 @@ def download_result(token):
             logger_handler.log_error('Invalid token payload - missing task_id')
             return request_handler.create_error_response('Invalid token payload', 401)
         
-        # Get application root directory for absolute paths
-        app_root = os.path.dirname(os.path.abspath(__file__))
-        
         # Get task status which will try to load from disk if not in memory
         task = task_handler.get_task_status(task_id)
-        logger_handler.log_system(f'App root directory: {app_root}')
-        logger_handler.log_system(f'Task info: {task}')
+        if logger_handler.is_debug_enabled():
+            # Formatting the whole task dict is costly, so only build the
+            # message when debug logging is actually on
+            logger_handler.log_debug(f'App root directory: {APP_ROOT}')
+            logger_handler.log_debug(f'Task info: {task}')
         
         # Check if task exists
         if task.get('status') == 'unknown':
@@ -649,47 +932,69 @@ def download_result(token):
         if not session_id:
             logger_handler.log_error(f'Session ID not found for task: {task_id}')
             return request_handler.create_error_response('Session ID not found', 404)
-        
+
+        # Bind the fields the branches below reuse to locals once, and
+        # compute the day-stamped download name a single time per request
+        today = _today_stamp(date.today().toordinal())
+        zip_path = task.get('zip_path')
+        output_folder = task.get('output_folder')
+        total_detections = task.get('total_detections')
+
         # If the task has a zip_path, use it directly
-        if task.get('zip_path'):
-            zip_path = task.get('zip_path')
-            
+        if zip_path:
+
             # Make sure zip_path is an absolute path
             if not os.path.isabs(zip_path):
-                zip_path = os.path.join(app_root, zip_path)
+                zip_path = os.path.join(APP_ROOT, zip_path)
                 
             logger_handler.log_system(f'Using stored ZIP path: {zip_path}')
             
-            if os.path.exists(zip_path) and os.path.getsize(zip_path) > 0:
+            # One stat covers the existence, size and mtime checks. The stat
+            # is deliberately unconditional: the cleanup sweep reaps output
+            # ZIPs after MAX_OUTPUT_AGE_HOURS while download tokens can
+            # still be valid, so cached completion-time metadata must not
+            # be trusted over the filesystem - a reaped ZIP falls through
+            # to the fallback/404 below instead of a send_file error
+            try:
+                zip_stat = os.stat(zip_path)
+                zip_size = zip_stat.st_size
+                zip_mtime = zip_stat.st_mtime
+            except OSError:
+                zip_size = 0
+                zip_mtime = None
+
+            if zip_size > 0:
                 # Setup proper headers with a consistent filename
-                timestamp = datetime.now().strftime("%Y%m%d")
-                filename = f"result_{timestamp}.zip"
-                
+                filename = f"result_{today}.zip"
+
                 logger_handler.log_file_operation('DOWNLOAD', zip_path)
                 response = send_file(
                     zip_path,
                     mimetype='application/zip',
                     as_attachment=True,
-                    download_name=filename
+                    download_name=filename,
+                    conditional=True,
+                    etag=True,
+                    max_age=0,
+                    last_modified=zip_mtime
                 )
                 
                 # Set detection headers
                 response.headers['X-Has-Detections'] = str(task.get('has_detections', False)).lower()
-                if task.get('total_detections') is not None:
-                    response.headers['X-Total-Detections'] = str(task.get('total_detections', 0))
-                
-                logger_handler.log_system(f'File download initiated with filename: {filename}, detections: {task.get("total_detections", 0)}')
+                if total_detections is not None:
+                    response.headers['X-Total-Detections'] = str(total_detections)
+
+                logger_handler.log_system(f'File download initiated with filename: {filename}, detections: {total_detections or 0}')
                 return response
             else:
                 logger_handler.log_error(f'ZIP file not found or empty: {zip_path}')
                 
         # If the task has an output_folder, try to find the output folder
-        if task.get('output_folder'):
-            output_folder = task.get('output_folder')
-            
+        if output_folder:
+
             # Make sure output_folder is an absolute path
             if not os.path.isabs(output_folder):
-                output_folder = os.path.join(app_root, output_folder)
+                output_folder = os.path.join(APP_ROOT, output_folder)
                 
             logger_handler.log_system(f'Using output folder: {output_folder}')
             
@@ -698,49 +1003,61 @@ def download_result(token):
                 no_detections_marker = os.path.join(output_folder, "no_detections.txt")
                 if os.path.exists(no_detections_marker):
                     logger_handler.log_system(f'Sending no_detections marker file for task {task_id}')
-                    timestamp = datetime.now().strftime("%Y%m%d")
                     response = send_file(
-                        no_detections_marker, 
+                        no_detections_marker,
                         mimetype='text/plain',
                         as_attachment=True,
-                        download_name=f'result_{timestamp}.txt'
+                        download_name=f'result_{today}.txt'
                     )
                     response.headers['X-Has-Detections'] = 'false'
                     return response
             
-            # Look for ZIP files in the output folder's parent directory
+            # Look for ZIP files in the output folder's parent directory;
+            # stop at the first non-empty match, reusing the stat data the
+            # scandir iterator already fetched
             parent_dir = os.path.dirname(output_folder)
-            timestamp_prefix = '_'.join(session_id.split('_')[:2])
-            
-            for filename in os.listdir(parent_dir):
-                if filename.startswith('result_') and filename.endswith('.zip'):
-                    zip_path = os.path.join(parent_dir, filename)
+
+            with os.scandir(parent_dir) as entries:
+                for entry in entries:
+                    if not (entry.name.startswith('result_') and entry.name.endswith('.zip')):
+                        continue
+
+                    entry_stat = entry.stat()
+                    if entry_stat.st_size == 0:
+                        continue
+
+                    zip_path = entry.path
                     logger_handler.log_system(f'Found ZIP file: {zip_path}')
-                    
-                    # Update task with zip_path
+
+                    # Update task with zip_path; skip the persistence write
+                    # when a racing download already recorded it
                     with task_handler.task_lock:
-                        if task_id in task_handler.active_tasks:
-                            task_handler.active_tasks[task_id]['zip_path'] = zip_path
+                        stored = task_handler.active_tasks.get(task_id)
+                        if stored is not None and not stored.get('zip_path'):
+                            stored['zip_path'] = zip_path
                             task_handler._save_tasks()
-                    
+
                     # Send the file
-                    timestamp = datetime.now().strftime("%Y%m%d")
-                    download_filename = f"result_{timestamp}.zip"
-                    
+                    download_filename = f"result_{today}.zip"
+
                     logger_handler.log_file_operation('DOWNLOAD', zip_path)
                     response = send_file(
                         zip_path,
                         mimetype='application/zip',
                         as_attachment=True,
-                        download_name=download_filename
+                        download_name=download_filename,
+                        conditional=True,
+                        etag=True,
+                        max_age=0,
+                        last_modified=entry_stat.st_mtime
                     )
                     
                     # Set detection headers
                     response.headers['X-Has-Detections'] = str(task.get('has_detections', True)).lower()
-                    if task.get('total_detections') is not None:
-                        response.headers['X-Total-Detections'] = str(task.get('total_detections', 0))
-                    
-                    logger_handler.log_system(f'File download initiated with filename: {download_filename}, detections: {task.get("total_detections", 0)}')
+                    if total_detections is not None:
+                        response.headers['X-Total-Detections'] = str(total_detections)
+
+                    logger_handler.log_system(f'File download initiated with filename: {download_filename}, detections: {total_detections or 0}')
                     return response
         
         # If we got here, we couldn't find a valid download file
@@ -748,7 +1065,7 @@ def download_result(token):
         return request_handler.create_error_response('ZIP path not found in task data', 404)
         
     except Exception as e:
-        logger_handler.log_error(f'Download error: {str(e)}', details=traceback.format_exc())
+        logger_handler.log_error(f'Download error: {str(e)}', details=_error_details())
         return request_handler.create_error_response(str(e), 500)
 
 @app.route('/web/cancel/<task_id>', methods=['POST'])
@@ -766,7 +1083,7 @@ def cancel_task(task_id):
             return request_handler.create_error_response('Task not found or cannot be cancelled', 404)
             
     except Exception as e:
-        logger_handler.log_error(str(e), details=traceback.format_exc())
+        logger_handler.log_error(str(e), details=_error_details())
         return request_handler.create_error_response(str(e), 500)
 
 @app.route('/server-status', methods=['GET'])
@@ -777,7 +1094,7 @@ def get_server_status():
         status = task_handler.get_server_status()
         return request_handler.create_success_response(status)
     except Exception as e:
-        logger_handler.log_error(str(e), details=traceback.format_exc())
+        logger_handler.log_error(str(e), details=_error_details())
         return request_handler.create_error_response(str(e), 500)
 
 @app.route('/')
@@ -788,29 +1105,33 @@ def index():
 @app.route('/debug_files', methods=['POST'])
 def debug_files():
     """Debug endpoint that just shows received files"""
-    print("\n==== DEBUG FILES ENDPOINT ====")
-    print(f"Request method: {request.method}")
-    print(f"Content-Type: {request.content_type}")
-    
-    # Print all request files
+    # Diagnostic endpoint: disabled unless debug logging is on, so
+    # production never pays for the inspection (or exposes it)
+    if not logger_handler.is_debug_enabled():
+        return {"disabled": True}, 404
+
     received_files = []
-    print("Files in request.files.keys():", list(request.files.keys()))
-    
-    for key in request.files:
-        files_list = request.files.getlist(key)
-        print(f"Key '{key}' has {len(files_list)} file(s)")
-        
-        for idx, file in enumerate(files_list):
-            if file and file.filename:
-                file_info = {
-                    "key": key,
-                    "index": idx,
-                    "filename": file.filename,
-                    "content_type": file.content_type
-                }
-                received_files.append(file_info)
-                print(f"  File {idx}: {file.filename} ({file.content_type})")
-    
+    lines = [
+        "==== DEBUG FILES ENDPOINT ====",
+        f"Request method: {request.method}",
+        f"Content-Type: {request.content_type}",
+    ]
+
+    # items(multi=True) walks every (key, file) pair in one pass instead
+    # of re-fetching getlist(key) per key
+    for idx, (key, file) in enumerate(request.files.items(multi=True)):
+        if file and file.filename:
+            received_files.append({
+                "key": key,
+                "index": idx,
+                "filename": file.filename,
+                "content_type": file.content_type
+            })
+            lines.append(f"  File {idx}: {file.filename} ({file.content_type})")
+
+    # One logger call instead of a stdout write per file
+    logger_handler.log_debug("\n".join(lines))
+
     # Return a simple JSON response with the files received
     return {
         "message": f"Received {len(received_files)} files",
@@ -818,5 +1139,8 @@ def debug_files():
     }, 200
 
 if __name__ == '__main__':
-    logger_handler.log_system('Starting Flask server on port 8000')
-    app.run(host='127.0.0.1', port=8000, debug=False) 
+    # Development only: the dev server handles one request at a time, so a
+    # long /predict blocks every status poll and download. Production runs
+    # under gunicorn (see gunicorn.conf.py and wsgi.py).
+    logger_handler.log_system('Starting Flask development server on port 8000')
+    app.run(host='127.0.0.1', port=8000, debug=False)
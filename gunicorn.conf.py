@@ -0,0 +1,30 @@
+"""Gunicorn configuration for the SightLinks backend.
+
+Task state (queue, active_tasks) lives in-process in TaskHandler, so the
+server runs a single worker with many threads by default. Raise WEB_WORKERS
+only once task state is shared across processes.
+"""
+
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+
+# gthread gives real concurrency for the I/O-bound endpoints (upload,
+# status polling, download) without duplicating the in-process task state
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_WORKERS', 1))
+threads = int(os.environ.get('WEB_THREADS', 8))
+
+# Long timeout: synchronous /predict waits for the full model pipeline
+timeout = int(os.environ.get('WEB_TIMEOUT', 600))
+
+loglevel = os.environ.get('LOG_LEVEL', 'info')
+
+def post_fork(server, worker):
+    """Start the app's background threads inside each worker.
+
+    The app skips its import-time thread start when it detects gunicorn,
+    so a preloaded master never forks half-started threads into workers.
+    """
+    from app import start_background_threads
+    start_background_threads()
@@ -333,8 +333,11 @@ def saveToOutput(outputType, outputFolder, imageDetections):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     zip_path = os.path.join(os.path.dirname(outputFolder), f"result_{timestamp}.zip")
     
+    # Build under a temporary name and rename into place once complete,
+    # so the API never picks up a partially written archive
+    tmp_zip_path = zip_path + '.tmp'
     try:
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(tmp_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             # Add detection files
             if os.path.exists(os.path.join(outputFolder, "detections.json")):
                 zipf.write(os.path.join(outputFolder, "detections.json"), "detections.json")
@@ -349,6 +352,7 @@ def saveToOutput(outputType, outputFolder, imageDetections):
                         file_path = os.path.join(labeled_images_dir, file)
                         zipf.write(file_path, os.path.join("labeledImages", file))
         
+        os.replace(tmp_zip_path, zip_path)
         print(f"ZIP file created at: {zip_path}")
         
         # Store the ZIP path in a file for the API to find
@@ -356,6 +360,12 @@ def saveToOutput(outputType, outputFolder, imageDetections):
             f.write(zip_path)
             
     except Exception as e:
+        # Don't leave a half-written temp archive behind; the cleanup sweep
+        # only reaps *.zip names
+        try:
+            os.remove(tmp_zip_path)
+        except OSError:
+            pass
         print(f"Error creating ZIP file: {str(e)}")
         print(traceback.format_exc())
     
@@ -4,6 +4,7 @@ from PIL import Image
 from tqdm import tqdm
 import os
 import sys
+import threading
 import traceback
 from osgeo import gdal
 
@@ -11,6 +12,44 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".
 from georeference.georeference import georeferenceTIF, georefereceJGW, BNGtoLatLong
 from utils.filterOutput import removeDuplicateBoxesRC, combineChunksToBaseName
 
+# Loaded YOLO models, keyed by model path and cached per worker thread.
+# Loading the weights takes hundreds of MB of I/O plus graph setup, so each
+# thread loads a model at most once instead of re-reading it on every
+# prediction call. The cache is thread-local rather than shared because
+# Ultralytics models carry predictor state and are not safe for concurrent
+# predict calls, and the task pool runs several tasks at once.
+_threadModels = threading.local()
+
+def getYoloModel(modelType):
+    """
+    Return a YOLO model instance for the given model type, loading it on first
+    use in the calling thread and reusing it for that thread's later
+    prediction calls.
+
+    Args:
+        modelType (str): The type of model used ('n', 's' or 'm').
+
+    Returns:
+        model (YOLO object): The loaded YOLO model.
+    """
+    models_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "models"))
+    modelPath = os.path.join(models_dir, f"yolo-{modelType}.pt")
+
+    cache = getattr(_threadModels, 'cache', None)
+    if cache is None:
+        cache = _threadModels.cache = {}
+
+    model = cache.get(modelPath)
+    if model is None:
+        print(f"\nLoading YOLO model from: {modelPath}")
+        if not os.path.exists(modelPath):
+            print(f"Model file not found at: {modelPath}")
+            print(f"Available model files: {os.listdir(models_dir)}")
+            raise FileNotFoundError(f"YOLO model file not found at: {modelPath}")
+        model = YOLO(modelPath)  # load an official model
+        cache[modelPath] = model
+    return model
+
 def predictionJGW(imageAndDatas, predictionThreshold=0.25, saveLabeledImage=False, outputFolder="run/output", modelType="n", boundBoxChunkSize=1024, classificationChunkSize=256):
     """
     This function will take all of the segmented image and their georeferencing data from imageAndDatas, where the model then 
@@ -31,17 +70,8 @@ def predictionJGW(imageAndDatas, predictionThreshold=0.25, saveLabeledImage=Fals
     Returns:
         imageDetections (dict): A dictionary where the basename of an image is the key, and the key stores a list of boxes in latitude and longitude, and their respective confidence
     """
-    # Get the absolute path to the models directory
-    models_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "models"))
-    modelPath = os.path.join(models_dir, f"yolo-{modelType}.pt")
-    
-    print(f"\nLoading YOLO model from: {modelPath}")
-    if not os.path.exists(modelPath):
-        print(f"Model file not found at: {modelPath}")
-        print(f"Available model files: {os.listdir(models_dir)}")
-        raise FileNotFoundError(f"YOLO model file not found at: {modelPath}")
-        
-    model = YOLO(modelPath)  # load an official model
+    # Reuse the shared model for this model type
+    model = getYoloModel(modelType)
     # Dictionary to store all detections and their confidence grouped by original image
     imageDetectionsRowCol = {}
     numOfSavedImages = 1
@@ -101,20 +131,11 @@ def predictionTIF(imageAndDatas, predictionThreshold=0.25, saveLabeledImage=Fals
     Returns:
         imageDetections (dict): A dictionary where the basename of an image is the key, and the key stores a list of boxes in latitude and longitude, and their respective confidence.
     """
-    # Get the absolute path to the models directory
-    models_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "models"))
-    modelPath = os.path.join(models_dir, f"yolo-{modelType}.pt")
-    
     print(f"\nStarting prediction with {len(imageAndDatas)} chunks")
-    print(f"Model path: {modelPath}")
     print(f"Prediction threshold: {predictionThreshold}")
-    
-    if not os.path.exists(modelPath):
-        print(f"Model file not found at: {modelPath}")
-        print(f"Available model files: {os.listdir(models_dir)}")
-        raise FileNotFoundError(f"YOLO model file not found at: {modelPath}")
-        
-    model = YOLO(modelPath)  # load an official model
+
+    # Reuse the shared model for this model type
+    model = getYoloModel(modelType)
     # Dictionary to store all detections and their confidence grouped by image, row, and column
     imageDetectionsRowCol = {}
     numOfSavedImages = 1
@@ -2,15 +2,26 @@
 
 import os
 import jwt
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 class AuthHandler:
     """Handles JWT token generation and verification."""
-    
+
     def __init__(self):
         """Initialize authentication handler with configuration."""
         self.JWT_SECRET = os.getenv('JWT_SECRET', 'your-secret-key')  # In production, use environment variable
         self.MAX_TOKEN_AGE_HOURS = 2  # Token expires after 2 hours
+
+        # Encode the secret once and reuse one algorithms list, so each
+        # sign/verify skips the per-call str.encode and list allocation
+        self._jwt_secret = self.JWT_SECRET.encode('utf-8')
+        self._jwt_algorithms = ['HS256']
+
+        # Tokens are immutable, so the signature check result can be cached
+        # for the token's lifetime; expiry is still enforced on every call
+        self._decode_token_cached = lru_cache(maxsize=4096)(self._decode_token)
     
     def generate_download_token(self, session_id, task_id):
         """Generate a JWT token for file download.
@@ -31,7 +42,7 @@ class AuthHandler:
         
         try:
             # Try using jwt.encode from PyJWT
-            token = jwt.encode(payload, self.JWT_SECRET, algorithm='HS256')
+            token = jwt.encode(payload, self._jwt_secret, algorithm='HS256')
             # In PyJWT 2.x, encode returns a string, in older versions it returns bytes
             if isinstance(token, bytes):
                 token = token.decode('utf-8')
@@ -42,25 +53,54 @@ class AuthHandler:
             token = pyjwt.generate_jwt(payload, self.JWT_SECRET, 'HS256', timedelta(hours=self.MAX_TOKEN_AGE_HOURS))
             return token
     
-    def verify_download_token(self, token):
-        """Verify JWT token and return payload if valid.
-        
+    def _decode_token(self, token):
+        """Decode and signature-check a JWT token (uncached).
+
         Args:
-            token (str): The JWT token to verify
-            
+            token (str): The JWT token to decode
+
         Returns:
-            dict: The token payload if valid, None otherwise
+            dict: The token payload if the signature is valid
+
+        Raises:
+            ValueError: If the token is invalid. Raising (rather than
+                returning None) keeps failed decodes out of the lru_cache,
+                so only successfully verified payloads are ever cached.
         """
         try:
             try:
                 # Try using jwt.decode from PyJWT
-                payload = jwt.decode(token, self.JWT_SECRET, algorithms=['HS256'])
+                payload = jwt.decode(token, self._jwt_secret, algorithms=self._jwt_algorithms)
                 return payload
             except AttributeError:
                 # Fallback to python-jwt if PyJWT is not available
                 import python_jwt as pyjwt
                 header, claims = pyjwt.verify_jwt(token, self.JWT_SECRET, ['HS256'])
                 return claims
-        except Exception:
+        except Exception as e:
             # Any other errors (expired token, invalid signature, etc.)
-            return None 
\ No newline at end of file
+            raise ValueError('Invalid token') from e
+
+    def verify_download_token(self, token):
+        """Verify JWT token and return payload if valid.
+
+        Signature verification is cached per token string, so repeated
+        downloads with the same token skip the HMAC work. Expiry is checked
+        on every call because a cached payload can outlive its token.
+
+        Args:
+            token (str): The JWT token to verify
+
+        Returns:
+            dict: The token payload if valid, None otherwise
+        """
+        try:
+            payload = self._decode_token_cached(token)
+        except ValueError:
+            return None
+
+        exp = payload.get('exp')
+        if exp is not None and time.time() > exp:
+            return None
+
+        return payload 
\ No newline at end of file
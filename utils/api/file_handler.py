@@ -23,6 +23,12 @@ class FileHandler:
             '0': {'zip', 'jpg', 'jpeg', 'png', 'jgw'},  # Type 0: jpg/png/jpeg + jgw or zip including these
             '1': {'zip', 'tif', 'tiff'}  # Type 1: GeoTIFF files or zip including them
         }
+        # Precomputed suffix tuples so allowed_file is a single C-level
+        # endswith call instead of a split + lower + set lookup per file
+        self._ALLOWED_SUFFIXES = {
+            input_type: tuple('.' + ext for ext in extensions)
+            for input_type, extensions in self.ALLOWED_EXTENSIONS.items()
+        }
         
         # Create base directories if they don't exist
         for folder in [self.BASE_UPLOAD_FOLDER, self.BASE_OUTPUT_FOLDER]:
@@ -40,24 +46,16 @@ class FileHandler:
         Returns:
             bool: True if the file extension is allowed, False otherwise
         """
+        suffixes = self._ALLOWED_SUFFIXES.get(input_type, self._ALLOWED_SUFFIXES['0'])
+        if filename.lower().endswith(suffixes):
+            return True
+
+        # Only rejections are worth a log line; accepts happen per file on
+        # every upload
         logger_handler = LoggerHandler()
-        
-        if '.' not in filename:
-            logger_handler.log_system(f"File {filename} has no extension, rejected")
-            return False
-            
-        ext = filename.rsplit('.', 1)[1].lower()
-        allowed = self.ALLOWED_EXTENSIONS.get(input_type, self.ALLOWED_EXTENSIONS['0'])
-        
-        is_allowed = ext in allowed
-        
-        if is_allowed:
-            logger_handler.log_system(f"File {filename} with extension {ext} is allowed for input_type {input_type}")
-        else:
-            logger_handler.log_system(f"File {filename} with extension {ext} is NOT allowed for input_type {input_type}")
-            logger_handler.log_system(f"Allowed extensions for input_type {input_type}: {allowed}")
-            
-        return is_allowed
+        logger_handler.log_system(f"File {filename} is NOT allowed for input_type {input_type}")
+        logger_handler.log_system(f"Allowed extensions for input_type {input_type}: {self.ALLOWED_EXTENSIONS.get(input_type, self.ALLOWED_EXTENSIONS['0'])}")
+        return False
     
     def create_session_folders(self):
         """Create unique session folders for input and output.
@@ -84,15 +82,15 @@ class FileHandler:
             logger_handler = LoggerHandler()
             
             logger_handler.log_system(f"Sending file: {filepath}")
-            
-            # Check if file exists
-            if not os.path.exists(filepath):
+
+            # One stat covers the existence, size and mtime checks
+            try:
+                file_stat = os.stat(filepath)
+            except OSError:
                 logger_handler.log_error(f"File does not exist: {filepath}")
                 return {'error': f'File not found: {filepath}'}, 404
-            
-            # Get file size
-            file_size = os.path.getsize(filepath)
-            if file_size == 0:
+
+            if file_stat.st_size == 0:
                 logger_handler.log_error(f"File is empty: {filepath}")
                 return {'error': f'File is empty: {filepath}'}, 500
             
@@ -111,13 +109,19 @@ class FileHandler:
             # Fixed filename for consistency
             filename = "results" + ext
             
-            # Use Flask's send_file directly
+            # Use Flask's send_file directly. send_file hands the open fd to
+            # the WSGI server's file_wrapper, which maps to sendfile(2) under
+            # gunicorn, so the bytes never pass through Python. conditional
+            # responses add ETag/Range support for large ZIPs.
             logger_handler.log_debug(f"Sending file {filepath} as {filename} with MIME type {mime_type}")
             return send_file(
                 filepath,
                 mimetype=mime_type,
                 as_attachment=True,
-                download_name=filename
+                download_name=filename,
+                conditional=True,
+                etag=True,
+                last_modified=file_stat.st_mtime
             )
         except Exception as e:
             logger_handler.log_error(f"Error sending file: {str(e)}", details=traceback.format_exc())
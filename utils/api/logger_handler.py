@@ -1,9 +1,10 @@
 """Logger handler for API requests and important events."""
 
 import os
+import queue
 import logging
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 class LoggerHandler:
     """Handles logging of API requests and important events."""
@@ -34,10 +35,13 @@ class LoggerHandler:
         if self.logger.handlers:
             self.logger.handlers.clear()
             
-        self.logger.setLevel(logging.INFO)
+        # Level is configurable so debug logging can be switched off in
+        # production without touching the call sites
+        level_name = os.environ.get('LOG_LEVEL', 'INFO').upper()
+        self.logger.setLevel(getattr(logging, level_name, logging.INFO))
         # Prevent propagation to root logger
         self.logger.propagate = False
-        
+
         # Create rotating file handler (new file each day, keep 30 days of logs)
         log_file = os.path.join(self.log_dir, f'api_{datetime.now().strftime("%Y%m%d")}.log')
         handler = RotatingFileHandler(
@@ -45,18 +49,26 @@ class LoggerHandler:
             maxBytes=10*1024*1024,  # 10MB
             backupCount=30
         )
-        
+
         # Create formatter
         formatter = logging.Formatter(
             '[%(asctime)s] %(levelname)s: %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         handler.setFormatter(formatter)
-        
-        # Add handler to logger
-        self.logger.addHandler(handler)
-        
+
+        # Emit through a queue so file I/O happens on a background listener
+        # thread instead of blocking request threads
+        self._log_queue = queue.Queue(-1)
+        self.logger.addHandler(QueueHandler(self._log_queue))
+        self._listener = QueueListener(self._log_queue, handler, respect_handler_level=True)
+        self._listener.start()
+
         self._initialized = True
+
+    def is_debug_enabled(self):
+        """Check whether debug-level logging is active."""
+        return self.logger.isEnabledFor(logging.DEBUG)
     
     def log_request(self, method, endpoint, params=None, status_code=None, error=None):
         """Log an API request."""
@@ -101,6 +113,10 @@ class LoggerHandler:
             message += f" | {details}"
         self.logger.info(message)
     
+    def log_debug(self, message):
+        """Log debug-level messages (dropped unless LOG_LEVEL=DEBUG)."""
+        self.logger.debug(f"DEBUG: {message}")
+
     def log_error(self, error_message, details=None):
         """Log error messages."""
         message = f"ERROR: {error_message}"
@@ -1,17 +1,78 @@
 """Request handler module for managing API requests."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from flask import jsonify
 from werkzeug.utils import secure_filename
 from utils.api.logger_handler import LoggerHandler
 
 class RequestHandler:
     """Handles API request parsing and response creation."""
-    
+
+    # Size of each chunk read/written when streaming uploads to disk
+    STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+    # Default processing parameters shared by every upload flow
+    PARAM_DEFAULTS = {
+        'classification_threshold': '0.35',
+        'prediction_threshold': '0.5',
+        'save_labeled_image': 'false',
+        'output_type': '0',
+        'yolo_model_type': 'm'
+    }
+
     def __init__(self, file_handler):
         """Initialize request handler with file handler."""
         self.file_handler = file_handler
     
+    def build_params(self, values, input_type='0'):
+        """Build and validate processing parameters in a single pass.
+
+        All upload flows (multipart form, JSON, query string, S3 callback)
+        funnel through this one schema check, so type and range errors are
+        caught here once instead of ad-hoc conversions downstream.
+
+        Args:
+            values: dict-like source of raw parameter values
+            input_type (str): The input type ('0' or '1')
+
+        Returns:
+            dict: Validated parameters with their final types (floats for
+                thresholds, bool for save_labeled_image, strings for the
+                enumerated options), ready to pass straight to execute
+
+        Raises:
+            ValueError: If any parameter is invalid
+        """
+        params = {'input_type': str(input_type)}
+        for key, default in self.PARAM_DEFAULTS.items():
+            value = values.get(key, default)
+            params[key] = str(value)
+
+        if params['input_type'] not in ('0', '1'):
+            raise ValueError(f"Invalid input_type: {params['input_type']} (expected '0' or '1')")
+
+        for key in ('classification_threshold', 'prediction_threshold'):
+            try:
+                threshold = float(params[key])
+            except ValueError:
+                raise ValueError(f"Invalid {key}: {params[key]} (expected a number)")
+            if not 0.0 <= threshold <= 1.0:
+                raise ValueError(f"Invalid {key}: {params[key]} (expected a value between 0 and 1)")
+            params[key] = threshold
+
+        if params['save_labeled_image'].lower() not in ('true', 'false'):
+            raise ValueError(f"Invalid save_labeled_image: {params['save_labeled_image']} (expected 'true' or 'false')")
+        params['save_labeled_image'] = params['save_labeled_image'].lower() == 'true'
+
+        if params['output_type'] not in ('0', '1'):
+            raise ValueError(f"Invalid output_type: {params['output_type']} (expected '0' or '1')")
+
+        if params['yolo_model_type'] not in ('n', 's', 'm'):
+            raise ValueError(f"Invalid yolo_model_type: {params['yolo_model_type']} (expected 'n', 's' or 'm')")
+
+        return params
+
     def parse_request_parameters(self, request):
         """Parse and validate request parameters.
         
@@ -25,14 +86,16 @@ class RequestHandler:
             ValueError: If request is invalid
         """
         logger_handler = LoggerHandler()
-        
-        print("\n=== DEBUG: New Request ===")
-        print(f"Content-Type: {request.content_type}")
-        print(f"Accept: {request.headers.get('Accept')}")
-        
-        print("\nDEBUG: Received Files:")
-        print(f"request.files keys: {list(request.files.keys())}")
-        
+
+        # Request inspection goes through the async logger at debug level;
+        # writing it to stdout per request serialized handlers on the
+        # stdout lock
+        debug = logger_handler.is_debug_enabled()
+        if debug:
+            logger_handler.log_debug(f"=== New Request === Content-Type: {request.content_type}, "
+                                     f"Accept: {request.headers.get('Accept')}, "
+                                     f"file keys: {list(request.files.keys())}")
+
         # Create session folders first
         session_id, input_folder = self.file_handler.create_session_folders()
         logger_handler.log_system(f"Created session folders - ID: {session_id}, Input folder: {input_folder}")
@@ -46,21 +109,20 @@ class RequestHandler:
         all_uploaded_files = []
         for key in request.files:
             files_for_key = request.files.getlist(key)
-            print(f"DEBUG: Key '{key}' has {len(files_for_key)} file(s)")
+            if debug:
+                logger_handler.log_debug(f"Key '{key}' has {len(files_for_key)} file(s)")
             for file in files_for_key:
                 if file and file.filename:
                     all_uploaded_files.append(file)
-                    print(f"DEBUG: File from key '{key}': {file.filename}")
-                    if '.' in file.filename:
-                        ext = file.filename.rsplit('.', 1)[1].lower()
-                        print(f"  Extension: {ext}")
-                else:
-                    print(f"DEBUG: Empty file for key '{key}'")
-                    
-        print(f"DEBUG: Total files received: {len(all_uploaded_files)}")
-        print(f"DEBUG: Form Data: {request.form.to_dict()}")
-        print(f"DEBUG: Is JSON? {request.is_json}")
-        
+                    if debug:
+                        logger_handler.log_debug(f"File from key '{key}': {file.filename}")
+                elif debug:
+                    logger_handler.log_debug(f"Empty file for key '{key}'")
+
+        if debug:
+            logger_handler.log_debug(f"Total files received: {len(all_uploaded_files)}, "
+                                     f"form data: {request.form.to_dict()}, is JSON: {request.is_json}")
+
         # Process files based on input type
         files = []
         jpg_jpeg_png_found = False
@@ -167,29 +229,15 @@ class RequestHandler:
         
         logger_handler.log_system(f"Validation passed - processing {len(files)} files")
         
-        # Get parameters based on content type
+        # Get parameters based on content type, validated in a single pass
         if request.content_type == 'application/json':
             json_data = request.get_json()
             if not json_data:
                 raise ValueError('Invalid JSON data')
-            
-            params = {
-                'input_type': input_type,
-                'classification_threshold': str(json_data.get('classification_threshold', '0.35')),
-                'prediction_threshold': str(json_data.get('prediction_threshold', '0.5')),
-                'save_labeled_image': str(json_data.get('save_labeled_image', 'false')),
-                'output_type': str(json_data.get('output_type', '0')),
-                'yolo_model_type': str(json_data.get('yolo_model_type', 'm'))
-            }
+
+            params = self.build_params(json_data, input_type)
         else:
-            params = {
-                'input_type': input_type,
-                'classification_threshold': request.form.get('classification_threshold', '0.35'),
-                'prediction_threshold': request.form.get('prediction_threshold', '0.5'),
-                'save_labeled_image': request.form.get('save_labeled_image', 'false'),
-                'output_type': request.form.get('output_type', '0'),
-                'yolo_model_type': request.form.get('yolo_model_type', 'm')
-            }
+            params = self.build_params(request.form, input_type)
         
         logger_handler.log_system(f"Content Type: {request.content_type}")
         logger_handler.log_system(f"Processed Parameters: {params}")
@@ -215,49 +263,142 @@ class RequestHandler:
         """Create a success response."""
         return data, 200
     
+    def save_uploaded_file_streaming(self, request, input_folder):
+        """Stream a raw (application/octet-stream) request body straight to disk.
+
+        This bypasses Werkzeug's multipart parser entirely: the body is read
+        from request.stream in 1 MiB chunks and written directly into the
+        input folder, so memory usage stays constant regardless of file size.
+
+        Args:
+            request: Flask request object with a raw body
+            input_folder (str): Folder to write the uploaded file to
+
+        Returns:
+            list: A single-element list with the saved file path
+        """
+        logger_handler = LoggerHandler()
+
+        filename = secure_filename(request.headers.get('X-Filename', 'upload.zip'))
+        if not filename:
+            filename = 'upload.zip'
+        filepath = os.path.join(input_folder, filename)
+
+        logger_handler.log_system("\n=== Streaming Upload to Disk ===")
+        logger_handler.log_system(f"Target path: {filepath}")
+
+        bytes_written = 0
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            while True:
+                chunk = request.stream.read(self.STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                bytes_written += len(chunk)
+
+        if bytes_written == 0:
+            os.remove(filepath)
+            raise ValueError("Empty request body - no file data received")
+
+        logger_handler.log_system(f"Streamed {bytes_written} bytes to {filepath}")
+        return [filepath]
+
+    def parse_stream_parameters(self, request):
+        """Parse processing parameters for a streamed (raw body) upload.
+
+        Raw uploads carry no form data, so parameters come from the query
+        string with the same defaults as the multipart path.
+
+        Args:
+            request: Flask request object
+
+        Returns:
+            dict: The processing parameters
+        """
+        return self.build_params(request.args, request.args.get('input_type', '0'))
+
+    def fetch_s3_upload(self, bucket, key, input_folder):
+        """Download a pre-uploaded object from S3 into the input folder.
+
+        Used by the direct-to-S3 flow: the client uploads straight to the
+        bucket via a pre-signed URL and posts the object key back, so the
+        upload never passes through the Flask worker.
+
+        Args:
+            bucket (str): The S3 bucket name
+            key (str): The object key posted back by the client
+            input_folder (str): Folder to download the object into
+
+        Returns:
+            list: A single-element list with the downloaded file path
+        """
+        import boto3  # Optional dependency, only needed for the S3 flow
+
+        logger_handler = LoggerHandler()
+
+        filename = secure_filename(os.path.basename(key))
+        if not filename:
+            filename = 'upload.zip'
+        filepath = os.path.join(input_folder, filename)
+
+        logger_handler.log_system(f"Downloading s3://{bucket}/{key} to {filepath}")
+        boto3.client('s3').download_file(bucket, key, filepath)
+
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            raise ValueError(f"Failed to download upload from S3: {key}")
+
+        logger_handler.log_system(f"Downloaded {os.path.getsize(filepath)} bytes from S3")
+        return [filepath]
+
+    def _save_one_file(self, file, input_folder):
+        """Save a single uploaded file and return its path."""
+        logger_handler = LoggerHandler()
+        filename = secure_filename(file.filename)
+        filepath = os.path.join(input_folder, filename)
+
+        # Check if file already exists (was saved during validation)
+        if os.path.exists(filepath):
+            logger_handler.log_system(f"File already exists: {filepath}")
+            return filepath
+
+        # Reset file position to beginning before saving
+        file.seek(0)
+
+        # Save file if it doesn't exist, copying in 1 MiB chunks
+        file.save(filepath, buffer_size=self.STREAM_CHUNK_SIZE)
+
+        # Verify file was saved
+        if os.path.exists(filepath):
+            logger_handler.log_system(f"File saved: {filepath} ({os.path.getsize(filepath)} bytes)")
+        else:
+            logger_handler.log_error(f"File was not saved successfully: {filepath}")
+
+        return filepath
+
     def save_uploaded_files(self, files, input_folder):
-        """Save uploaded files to the input folder."""
+        """Save uploaded files to the input folder.
+
+        Saves are independent and IO-bound, so multi-file uploads are
+        written through a small thread pool: the interpreter releases the
+        GIL during the copy syscalls, letting the kernel overlap the disk
+        writes. Single-file uploads skip the pool entirely.
+        """
         logger_handler = LoggerHandler()
-        saved_files = []
-        
+
         logger_handler.log_system("\n=== Saving Uploaded Files ===")
         logger_handler.log_system(f"Input folder: {input_folder}")
         logger_handler.log_system(f"Number of files to save: {len(files)}")
-        
-        for file in files:
-            filename = secure_filename(file.filename)
-            filepath = os.path.join(input_folder, filename)
-            logger_handler.log_system(f"\nSaving file: {filename}")
-            logger_handler.log_system(f"Full path: {filepath}")
-            
-            # Check if file already exists (was saved during validation)
-            if os.path.exists(filepath):
-                size = os.path.getsize(filepath)
-                logger_handler.log_system(f"File already exists. Size: {size} bytes")
-                saved_files.append(filepath)
-                continue
-            
-            # Reset file position to beginning before saving
-            file.seek(0)
-            
-            # Save file if it doesn't exist
-            file.save(filepath)
-            
-            # Verify file was saved
-            if os.path.exists(filepath):
-                size = os.path.getsize(filepath)
-                logger_handler.log_system(f"File saved successfully. Size: {size} bytes")
-            else:
-                logger_handler.log_error(f"File was not saved successfully: {filepath}")
-            
-            saved_files.append(filepath)
-            
-        logger_handler.log_system("\n=== Saved Files Summary ===")
+
+        if len(files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+                # map preserves input order in the returned paths
+                saved_files = list(pool.map(lambda f: self._save_one_file(f, input_folder), files))
+        else:
+            saved_files = [self._save_one_file(file, input_folder) for file in files]
+
         logger_handler.log_system(f"Total files saved: {len(saved_files)}")
-        for path in saved_files:
-            logger_handler.log_system(f"- {path}")
-        logger_handler.log_system("=======================\n")
-        
+
         return saved_files
     
     def wants_json_response(self, request):
@@ -1,5 +1,6 @@
 """Task handler module for managing task processing and cleanup."""
 
+import gc
 import os
 import sys
 import time
@@ -12,6 +13,11 @@ import queue
 import psutil
 import rasterio
 import traceback
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, Future
 from utils.compress import compress_folder_to_zip
@@ -27,14 +33,21 @@ class TaskHandler:
         self.BASE_EXTRACT_FOLDER = 'run/extract'
         self.MAX_FILE_AGE_HOURS = 2  # For input files
         self.MAX_OUTPUT_AGE_HOURS = 2  # For output files and zips
-        self.MAX_QUEUE_SIZE = 10
-        self.MAX_CONCURRENT_TASKS = 5
+        self.MAX_QUEUE_SIZE = int(os.environ.get('MAX_QUEUE', 10))
+        # Size the worker pool to the hardware by default: model inference is
+        # CPU/GPU bound, so more workers than cores just thrash the YOLO model
+        default_workers = max(1, (os.cpu_count() or 2) // 2)
+        self.MAX_CONCURRENT_TASKS = int(os.environ.get('MAX_CONCURRENT_TASKS', default_workers))
+        self.MAX_SYNC_TASKS = int(os.environ.get('MAX_SYNC_TASKS', 2))
         
         # Setup logger
         self.logger = LoggerHandler()
         
+        # Application root, for persistence and for normalizing stored paths
+        self.APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
         # Tasks persistence file - use absolute path
-        self.TASKS_DB_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'tasks_db.json')
+        self.TASKS_DB_FILE = os.path.join(self.APP_ROOT, 'tasks_db.json')
         self.logger.log_system(f"Using tasks database file: {self.TASKS_DB_FILE}")
 
         # Task queue and tracking
@@ -43,6 +56,17 @@ class TaskHandler:
         self.task_lock = threading.Lock()
         self.cancelled_tasks = set()  # Track cancelled tasks
         self.task_events = {}  # Track cancellation events for each task
+        self.completion_events = {}  # Wake synchronous waiters on completion
+
+        # Folders queued for deletion by the cleanup thread. Request-path
+        # code (e.g. cancel_task) appends here instead of calling rmtree
+        # inline, so disk reclaim never holds up a response or task_lock.
+        self.pending_cleanup = []
+
+        # Admission control for the synchronous /predict path: callers that
+        # cannot acquire a slot are rejected immediately instead of piling
+        # up uploads and starving the queue workers
+        self.sync_task_semaphore = threading.BoundedSemaphore(self.MAX_SYNC_TASKS)
         
         # Load existing tasks from disk if available
         self._load_tasks()
@@ -166,7 +190,13 @@ class TaskHandler:
         return task_id
 
     def queue_task(self, task):
-        """Add a task to the processing queue."""
+        """Add a task to the processing queue.
+
+        Raises:
+            queue.Full: If the queue is at capacity. Callers should turn
+                this into a 503; the endpoint-level full() checks are only
+                advisory fast-fails and can race with other requests.
+        """
         with self.task_lock:
             task_id = task['id']
             # Get current queue size before adding new task
@@ -196,13 +226,57 @@ class TaskHandler:
                 self.stats['queued_tasks'] = current_queue_size + 1
                 self.logger.log_system(f'Task {task_id} queued (position {current_queue_size + 1}, total queued: {current_queue_size + 1})')
 
-            # Put task in queue AFTER updating status
-            self.task_queue.put(task)
+            # Put task in queue AFTER updating status; put_nowait keeps the
+            # capacity check and the enqueue atomic
+            try:
+                self.task_queue.put_nowait(task)
+            except queue.Full:
+                # Roll back the optimistic bookkeeping before re-raising
+                self.active_tasks.pop(task_id, None)
+                self.task_events.pop(task_id, None)
+                with self.stats_lock:
+                    self.stats['queued_tasks'] = current_queue_size
+                raise
             self.logger.log_task_status(task_id, 'queued', stage=f'Added to queue (position {current_queue_size + 1})')
 
             # Update queue positions for all queued tasks
             self._update_queue_positions()
 
+    def _signal_completion(self, task_id):
+        """Wake any synchronous caller waiting on this task."""
+        with self.task_lock:
+            event = self.completion_events.get(task_id)
+        if event is not None:
+            event.set()
+
+    def wait_for_task(self, task_id, timeout=None):
+        """Block until a queued task reaches a final state.
+
+        Used by the synchronous /predict path, which queues work through
+        the same pipeline as /web/predict but holds the HTTP request open
+        until processing finishes.
+
+        Args:
+            task_id (str): The ID of the task to wait for
+            timeout (float, optional): Maximum seconds to wait
+
+        Returns:
+            dict: The final task record, or None if the wait timed out.
+        """
+        with self.task_lock:
+            event = self.completion_events.setdefault(task_id, threading.Event())
+            task = self.active_tasks.get(task_id)
+            # The task may already be final (e.g. a fast failure)
+            if task and task.get('status') in ('completed', 'failed', 'cancelled'):
+                event.set()
+
+        finished = event.wait(timeout)
+
+        with self.task_lock:
+            self.completion_events.pop(task_id, None)
+            task = self.active_tasks.get(task_id)
+        return dict(task) if (finished and task) else None
+
     def get_task_status(self, task_id):
         """Get the status of a task."""
         if not task_id:
@@ -211,49 +285,56 @@ class TaskHandler:
                 'error': 'Invalid task ID'
             }
 
+        # Keep the critical section tiny: in-memory hits copy the dict and
+        # release immediately, so pollers never serialize behind each other
+        # or behind worker progress writes
         with self.task_lock:
-            # First check if task is in memory
             task = self.active_tasks.get(task_id)
-            
-            # If not in memory, try to load it from the persistent file
-            if not task:
-                try:
-                    if os.path.exists(self.TASKS_DB_FILE):
-                        with open(self.TASKS_DB_FILE, 'r') as f:
-                            tasks_db = json.load(f)
-                            task = tasks_db.get(task_id)
-                            
-                            if task:
-                                self.logger.log_system(f"Retrieved task {task_id} from disk")
-                                # Convert ISO datetime strings back to datetime objects
-                                if 'created_at' in task and isinstance(task['created_at'], str):
-                                    try:
-                                        task['created_at'] = datetime.fromisoformat(task['created_at'])
-                                    except ValueError:
-                                        task['created_at'] = datetime.now()
-                                
-                                # Add back to active_tasks if it's a completed task with outputs
-                                if task.get('status') == 'completed' and (task.get('output_folder') or task.get('zip_path')):
-                                    self.active_tasks[task_id] = task
-                except Exception as e:
-                    self.logger.log_error(f"Error loading task {task_id} from file: {str(e)}")
-            
-            if not task:
-                return {
-                    'status': 'unknown',
-                    'error': 'Task not found'
-                }
-            
-            # Ensure session_id is set
-            if 'session_id' not in task:
-                # Try to get session_id from input_folder
-                if 'input_folder' in task:
-                    task['session_id'] = os.path.basename(task['input_folder'])
-                else:
-                    # Generate a new session_id if none exists
-                    task['session_id'] = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
-            
-            return task.copy()  # Return a copy to prevent external modification
+            if task:
+                task = task.copy()
+
+        # If not in memory, try to load it from the persistent file without
+        # holding the lock across the disk read
+        if not task:
+            try:
+                if os.path.exists(self.TASKS_DB_FILE):
+                    with open(self.TASKS_DB_FILE, 'r') as f:
+                        tasks_db = json.load(f)
+                        task = tasks_db.get(task_id)
+
+                    if task:
+                        self.logger.log_system(f"Retrieved task {task_id} from disk")
+                        # Convert ISO datetime strings back to datetime objects
+                        if 'created_at' in task and isinstance(task['created_at'], str):
+                            try:
+                                task['created_at'] = datetime.fromisoformat(task['created_at'])
+                            except ValueError:
+                                task['created_at'] = datetime.now()
+
+                        # Add back to active_tasks if it's a completed task with outputs
+                        if task.get('status') == 'completed' and (task.get('output_folder') or task.get('zip_path')):
+                            with self.task_lock:
+                                self.active_tasks.setdefault(task_id, task)
+                        task = task.copy()
+            except Exception as e:
+                self.logger.log_error(f"Error loading task {task_id} from file: {str(e)}")
+
+        if not task:
+            return {
+                'status': 'unknown',
+                'error': 'Task not found'
+            }
+
+        # Ensure session_id is set (on the copy; callers only read it)
+        if 'session_id' not in task:
+            # Try to get session_id from input_folder
+            if 'input_folder' in task:
+                task['session_id'] = os.path.basename(task['input_folder'])
+            else:
+                # Generate a new session_id if none exists
+                task['session_id'] = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
+
+        return task
 
     def _get_queue_position(self, task_id):
         """Get the position of a task in the queue (1-based)."""
@@ -329,16 +410,16 @@ class TaskHandler:
                     if 'future' in task:
                         del task['future']
 
-            # Clean up input folder if exists
+            # Hand the input folder to the cleanup thread instead of
+            # removing it inline: rmtree of a large upload takes seconds
+            # and this runs while holding task_lock, which would stall
+            # every status poll in the meantime
             input_folder = task.get('input_folder')
             if input_folder and os.path.exists(input_folder):
-                try:
-                    shutil.rmtree(input_folder)
-                    self.logger.log_cleanup('input_folder', input_folder)
-                except Exception as e:
-                    self.logger.log_error(f'Error cleaning up input folder: {str(e)}')
+                self.pending_cleanup.append(input_folder)
+                self.logger.log_system(f'Queued input folder for deferred cleanup: {input_folder}')
 
-            # Clean up extract directory
+            # Queue the extract directory the same way
             try:
                 # Extract directory is named with the same timestamp as the task
                 session_id = task.get('session_id')
@@ -346,17 +427,17 @@ class TaskHandler:
                     # Extract timestamp from session_id (format: YYYYMMDD_HHMMSS_uuid)
                     timestamp = '_'.join(session_id.split('_')[:2])
                     extract_base_dir = 'run/extract'
-                    
+
                     # Look for extract directories with matching timestamp
                     if os.path.exists(extract_base_dir):
                         for dir_name in os.listdir(extract_base_dir):
                             if dir_name.startswith(timestamp):
                                 extract_dir = os.path.join(extract_base_dir, dir_name)
                                 if os.path.exists(extract_dir):
-                                    shutil.rmtree(extract_dir)
-                                    self.logger.log_cleanup('extract_dir', extract_dir)
+                                    self.pending_cleanup.append(extract_dir)
+                                    self.logger.log_system(f'Queued extract directory for deferred cleanup: {extract_dir}')
             except Exception as e:
-                self.logger.log_error(f'Error cleaning up extract directory: {str(e)}')
+                self.logger.log_error(f'Error queueing extract directory for cleanup: {str(e)}')
 
             self.logger.log_task_status(task_id, 'cancelled', progress=100, stage='Cancelled by user')
             return True
@@ -441,13 +522,14 @@ class TaskHandler:
             
             # Execute the task with the input folder containing the saved files
             try:
-                # Convert parameters to their proper types
-                input_type = str(params['input_type'])
-                classification_threshold = float(params['classification_threshold'])
-                prediction_threshold = float(params['prediction_threshold'])
-                save_labeled_image = params['save_labeled_image'].lower() == 'true' if isinstance(params['save_labeled_image'], str) else bool(params['save_labeled_image'])
-                output_type = str(params['output_type'])
-                yolo_model_type = str(params['yolo_model_type'])
+                # Parameters arrive already validated and typed from
+                # RequestHandler.build_params, so no per-task reconversion
+                input_type = params['input_type']
+                classification_threshold = params['classification_threshold']
+                prediction_threshold = params['prediction_threshold']
+                save_labeled_image = params['save_labeled_image']
+                output_type = params['output_type']
+                yolo_model_type = params['yolo_model_type']
                 
                 logger_handler.log_system("\nExecuting main processing function with parameters:")
                 logger_handler.log_system(f"- Input folder: {input_folder}")
@@ -478,7 +560,15 @@ class TaskHandler:
                 )
                 
                 logger_handler.log_system(f"\nMain processing completed. Output folder: {output_folder}")
-                
+
+                # Verify the output ZIP once, here on the producer side, so
+                # downloads only need a stat + sendfile
+                zip_info = self._verify_output_zip(task_id, output_folder)
+
+                # Compute detection status once so status polls never touch
+                # the output folder again
+                detection_info = self._compute_detection_status(output_folder)
+
                 # Update task status with output information
                 with self.task_lock:
                     if task_id in self.active_tasks:
@@ -489,6 +579,9 @@ class TaskHandler:
                             'output_folder': output_folder,
                             'session_id': session_id  # Ensure session_id is preserved
                         })
+                        if zip_info:
+                            self.active_tasks[task_id].update(zip_info)
+                        self.active_tasks[task_id].update(detection_info)
                 
                 # Log task completion
                 logger_handler.log_system("\n=== Task Completed Successfully ===")
@@ -673,8 +766,116 @@ class TaskHandler:
 
             raise
 
+    def _compute_detection_status(self, output_folder):
+        """Compute detection status once at task completion.
+
+        Reads the no_detections marker or detections.json a single time and
+        returns the values to cache on the task dict, so that every status
+        poll is answered from memory instead of re-reading the output folder.
+
+        Args:
+            output_folder (str): The task's output folder
+
+        Returns:
+            dict: {'has_detections': bool, 'total_detections': int}
+        """
+        has_detections = False
+        total_detections = 0
+        try:
+            if not output_folder or not os.path.exists(output_folder):
+                return {'has_detections': False, 'total_detections': 0}
+
+            if os.path.exists(os.path.join(output_folder, "no_detections.txt")):
+                return {'has_detections': False, 'total_detections': 0}
+
+            json_path = os.path.join(output_folder, "detections.json")
+            if os.path.exists(json_path) and os.path.getsize(json_path) > 10:
+                with open(json_path, 'rb') as f:
+                    content = f.read()
+                # orjson parses large detection lists several times faster
+                # than the stdlib when it is installed
+                data = orjson.loads(content) if orjson is not None else json.loads(content)
+                for item in data:
+                    coordinates = item.get('coordinates', [])
+                    if isinstance(coordinates, list):
+                        total_detections += len(coordinates)
+                has_detections = total_detections > 0
+            else:
+                # TXT output: count non-empty lines across detection files.
+                # scandir supplies name and size together, so empty files are
+                # skipped without a separate getsize stat per file
+                with os.scandir(output_folder) as entries:
+                    txt_paths = [entry.path for entry in entries
+                                 if entry.name.endswith('.txt')
+                                 and entry.name not in ("no_detections.txt", "zip_path.txt")
+                                 and entry.stat(follow_symlinks=False).st_size > 0]
+                for txt_path in txt_paths:
+                    with open(txt_path, 'rb') as f:
+                        total_detections += sum(1 for line in f.read().split(b'\n') if line.strip())
+                has_detections = total_detections > 0
+
+            self.logger.log_system(f"Detection status for {output_folder}: has_detections={has_detections}, total_detections={total_detections}")
+        except Exception as e:
+            self.logger.log_error(f"Error computing detection status: {str(e)}")
+
+        return {'has_detections': has_detections, 'total_detections': total_detections}
+
+    def _verify_output_zip(self, task_id, output_folder):
+        """Verify the output ZIP once at task completion.
+
+        Runs the CRC check and reads the member list a single time so that
+        download requests never have to re-open the archive.
+
+        Args:
+            task_id (str): The ID of the completed task
+            output_folder (str): The task's output folder
+
+        Returns:
+            dict: ZIP metadata ('zip_path', 'zip_verified', 'zip_size',
+                  'zip_file_count') to merge into the task, or None if no ZIP
+                  was produced (e.g. no detections).
+        """
+        try:
+            zip_path_file = os.path.join(output_folder, "zip_path.txt")
+            if not os.path.exists(zip_path_file):
+                return None
+
+            with open(zip_path_file, "r") as f:
+                zip_path = f.read().strip()
+
+            if not zip_path or not os.path.exists(zip_path):
+                self.logger.log_error(f"ZIP path from zip_path.txt does not exist: {zip_path}")
+                return None
+
+            # The archive was written by this process moments earlier, so a
+            # full decompress-and-CRC pass (testzip) would just redo the
+            # compression work. Opening the archive parses and validates the
+            # central directory, which catches truncated or misdirected
+            # writes at a fraction of the cost.
+            with zipfile.ZipFile(zip_path, 'r') as zf:
+                # infolist() is the already-parsed central directory; only
+                # the entry count is kept so the task record (persisted to
+                # tasks_db.json) stays small for archives with many members
+                file_count = len(zf.infolist())
+                if file_count == 0:
+                    raise Exception("ZIP file is empty")
+
+            zip_stat = os.stat(zip_path)
+            self.logger.log_system(f"Verified output ZIP for task {task_id}: {zip_path} ({zip_stat.st_size} bytes, {file_count} files)")
+            return {
+                'zip_path': zip_path,
+                'zip_verified': True,
+                'zip_size': zip_stat.st_size,
+                'zip_mtime': zip_stat.st_mtime,
+                'zip_file_count': file_count
+            }
+        except Exception as e:
+            self.logger.log_error(f"Error verifying output ZIP for task {task_id}: {str(e)}")
+            return None
+
     def _create_zip_file(self, task_id, output_folder):
         """Create a ZIP file for the task."""
+        tmp_path = None
         try:
             # Get descriptor for the zip file name based on detection status
             descriptor = "detections"
@@ -697,7 +898,12 @@ class TaskHandler:
                 os.remove(zip_path)
                 self.logger.log_cleanup('old_zip', zip_path)
 
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # Build under a temporary name and publish with an atomic rename
+            # once verified, so the download fallback (which picks the newest
+            # result_*.zip in the folder) can never grab a half-written file
+            tmp_path = zip_path + '.tmp'
+
+            with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
                 # Get all files in the output folder
                 for root, _, files in os.walk(output_folder):
                     for file in files:
@@ -706,9 +912,9 @@ class TaskHandler:
                             if output_folder and os.path.exists(output_folder):
                                 shutil.rmtree(output_folder)
                                 self.logger.log_cleanup('output_folder', output_folder)
-                            if os.path.exists(zip_path):
-                                os.remove(zip_path)
-                                self.logger.log_cleanup('zip_file', zip_path)
+                            if os.path.exists(tmp_path):
+                                os.remove(tmp_path)
+                                self.logger.log_cleanup('zip_file', tmp_path)
                             raise Exception("Task cancelled during ZIP creation")
                             
                         # Get the full file path
@@ -723,24 +929,32 @@ class TaskHandler:
                         zipf.write(file_path, rel_path)
             
             # Verify the zip file was created properly
-            if not os.path.exists(zip_path):
-                raise Exception(f"ZIP file was not created at {zip_path}")
-                
-            # Verify zip file integrity
-            with zipfile.ZipFile(zip_path, 'r') as verify_zip:
+            if not os.path.exists(tmp_path):
+                raise Exception(f"ZIP file was not created at {tmp_path}")
+
+            # Verify zip file integrity before publishing it
+            with zipfile.ZipFile(tmp_path, 'r') as verify_zip:
                 # Test if any files in the archive are corrupted
                 bad_file = verify_zip.testzip()
                 if bad_file:
                     raise Exception(f"ZIP file is corrupted. Bad file: {bad_file}")
-                
+
                 # Verify the zip has contents
-                if len(verify_zip.namelist()) == 0:
+                if len(verify_zip.infolist()) == 0:
                     raise Exception("ZIP file is empty")
-                    
+
+            os.replace(tmp_path, zip_path)
             self.logger.log_system(f'Successfully created and verified ZIP file: {zip_path}')
             return zip_path
 
         except Exception as e:
+            # Remove any half-written temp archive; the cleanup sweep only
+            # reaps *.zip names, so a leaked .zip.tmp would linger forever
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             self.logger.log_error(f'Error creating ZIP file: {str(e)}')
             raise
 
@@ -787,7 +1001,12 @@ class TaskHandler:
                                                                      if t.get('status') == 'processing'])
                                 self._update_queue_positions()
                             self.task_queue.task_done()
-                            continue
+                        # Wake any synchronous caller blocked in
+                        # wait_for_task, as the error path and
+                        # task_wrapper's finally already do (outside the
+                        # lock: _signal_completion takes task_lock itself)
+                        self._signal_completion(task_id)
+                        continue
 
                 if self.shutdown_flag.is_set():
                     break
@@ -848,6 +1067,7 @@ class TaskHandler:
                         with self.task_lock:
                             if task['id'] in self.processing_tasks:
                                 self.processing_tasks.remove(task['id'])
+                        self._signal_completion(task['id'])
                         self.task_queue.task_done()
 
                 future = self.thread_pool.submit(task_wrapper, task)
@@ -871,6 +1091,7 @@ class TaskHandler:
                                 'error': str(e),
                                 'progress': 100
                             })
+                    self._signal_completion(task_id)
                     self.task_queue.task_done()
 
         self.is_running = False
@@ -885,6 +1106,25 @@ class TaskHandler:
                 current_time = datetime.now()
                 self.logger.log_system(f'Running scheduled cleanup at {current_time.strftime("%Y-%m-%d %H:%M:%S")}')
 
+                # Session names start with a fixed-width YYYYMMDD_HHMMSS
+                # timestamp, so they order lexicographically; comparing
+                # against these precomputed cutoffs replaces a strptime
+                # call per directory entry
+                input_cutoff = (current_time - timedelta(hours=self.MAX_FILE_AGE_HOURS)).strftime('%Y%m%d_%H%M%S')
+                output_cutoff = (current_time - timedelta(hours=self.MAX_OUTPUT_AGE_HOURS)).strftime('%Y%m%d_%H%M%S')
+
+                # Drain folders handed off by the request path (cancelled
+                # tasks) before the age-based sweeps
+                with self.task_lock:
+                    deferred, self.pending_cleanup = self.pending_cleanup, []
+                for path in deferred:
+                    try:
+                        if os.path.isdir(path):
+                            shutil.rmtree(path)
+                            self.logger.log_cleanup('deferred_folder', path)
+                    except Exception as e:
+                        self.logger.log_error(f'Error cleaning deferred folder {path}: {str(e)}')
+
                 with self.task_lock:
                     # Get list of active tasks to prevent cleaning up in-use folders
                     active_input_folders = {
@@ -923,37 +1163,52 @@ class TaskHandler:
                 if os.path.exists(self.BASE_UPLOAD_FOLDER):
                     self.logger.log_system(f'Checking for old input folders in {self.BASE_UPLOAD_FOLDER}')
                     input_folders_cleaned = 0
-                    for folder in os.listdir(self.BASE_UPLOAD_FOLDER):
-                        if self.shutdown_flag.is_set():
-                            break
+                    stale_inputs = []
+                    # os.scandir caches stat info from the directory read, so
+                    # each entry costs at most one extra syscall; victims are
+                    # collected first so deletions never mutate the directory
+                    # while it is being iterated
+                    with os.scandir(self.BASE_UPLOAD_FOLDER) as entries:
+                        for entry in entries:
+                            if self.shutdown_flag.is_set():
+                                break
+
+                            path = entry.path
+                            if path in active_input_folders:
+                                continue
+
+                            if entry.is_dir(follow_symlinks=False):
+                                try:
+                                    # Check folder age by timestamp format or modification time
+                                    is_old = False
 
-                        path = os.path.join(self.BASE_UPLOAD_FOLDER, folder)
-                        if path in active_input_folders:
-                            continue
+                                    # First try to parse from folder name
+                                    try:
+                                        parts = entry.name.split('_')
+                                        timestamp = parts[0] + '_' + parts[1]
+                                        if len(timestamp) != 15 or not (parts[0].isdigit() and parts[1].isdigit()):
+                                            raise ValueError(timestamp)
+                                        if timestamp < input_cutoff:
+                                            is_old = True
+                                    except (ValueError, IndexError):
+                                        # If we can't parse from name, use modification time
+                                        mod_time = datetime.fromtimestamp(entry.stat(follow_symlinks=False).st_mtime)
+                                        if current_time - mod_time > timedelta(hours=self.MAX_FILE_AGE_HOURS):
+                                            is_old = True
+
+                                    if is_old:
+                                        stale_inputs.append(path)
+                                except Exception as e:
+                                    self.logger.log_error(f'Error checking input folder {path}: {str(e)}')
+
+                    for path in stale_inputs:
+                        try:
+                            shutil.rmtree(path)
+                            input_folders_cleaned += 1
+                            self.logger.log_cleanup('old_input', path)
+                        except Exception as e:
+                            self.logger.log_error(f'Error cleaning input folder {path}: {str(e)}')
 
-                        if os.path.isdir(path):
-                            try:
-                                # Check folder age by timestamp format or modification time
-                                is_old = False
-                                
-                                # First try to parse from folder name
-                                try:
-                                    folder_time = datetime.strptime(folder.split('_')[0] + '_' + folder.split('_')[1], '%Y%m%d_%H%M%S')
-                                    if current_time - folder_time > timedelta(hours=self.MAX_FILE_AGE_HOURS):
-                                        is_old = True
-                                except (ValueError, IndexError):
-                                    # If we can't parse from name, use modification time
-                                    mod_time = datetime.fromtimestamp(os.path.getmtime(path))
-                                    if current_time - mod_time > timedelta(hours=self.MAX_FILE_AGE_HOURS):
-                                        is_old = True
-                                
-                                if is_old:
-                                    shutil.rmtree(path)
-                                    input_folders_cleaned += 1
-                                    self.logger.log_cleanup('old_input', path)
-                            except Exception as e:
-                                self.logger.log_error(f'Error cleaning input folder {path}: {str(e)}')
-                    
                     if input_folders_cleaned > 0:
                         self.logger.log_system(f'Cleaned up {input_folders_cleaned} old input folders')
 
@@ -961,25 +1216,33 @@ class TaskHandler:
                 if os.path.exists(self.BASE_EXTRACT_FOLDER):
                     self.logger.log_system(f'Checking for old extract folders in {self.BASE_EXTRACT_FOLDER}')
                     extract_folders_cleaned = 0
-                    for folder in os.listdir(self.BASE_EXTRACT_FOLDER):
-                        if self.shutdown_flag.is_set():
-                            break
-                            
-                        path = os.path.join(self.BASE_EXTRACT_FOLDER, folder)
-                        if path in active_extract_folders:
-                            continue
-                            
-                        if os.path.isdir(path):
-                            try:
-                                # Use modification time to determine age
-                                mod_time = datetime.fromtimestamp(os.path.getmtime(path))
-                                if current_time - mod_time > timedelta(hours=self.MAX_FILE_AGE_HOURS):
-                                    shutil.rmtree(path)
-                                    extract_folders_cleaned += 1
-                                    self.logger.log_cleanup('old_extract', path)
-                            except Exception as e:
-                                self.logger.log_error(f'Error cleaning extract folder {path}: {str(e)}')
-                    
+                    stale_extracts = []
+                    with os.scandir(self.BASE_EXTRACT_FOLDER) as entries:
+                        for entry in entries:
+                            if self.shutdown_flag.is_set():
+                                break
+
+                            path = entry.path
+                            if path in active_extract_folders:
+                                continue
+
+                            if entry.is_dir(follow_symlinks=False):
+                                try:
+                                    # Use modification time to determine age
+                                    mod_time = datetime.fromtimestamp(entry.stat(follow_symlinks=False).st_mtime)
+                                    if current_time - mod_time > timedelta(hours=self.MAX_FILE_AGE_HOURS):
+                                        stale_extracts.append(path)
+                                except Exception as e:
+                                    self.logger.log_error(f'Error checking extract folder {path}: {str(e)}')
+
+                    for path in stale_extracts:
+                        try:
+                            shutil.rmtree(path)
+                            extract_folders_cleaned += 1
+                            self.logger.log_cleanup('old_extract', path)
+                        except Exception as e:
+                            self.logger.log_error(f'Error cleaning extract folder {path}: {str(e)}')
+
                     if extract_folders_cleaned > 0:
                         self.logger.log_system(f'Cleaned up {extract_folders_cleaned} old extract folders')
 
@@ -988,56 +1251,75 @@ class TaskHandler:
                     self.logger.log_system(f'Checking for old output folders and ZIP files in {self.BASE_OUTPUT_FOLDER}')
                     output_cleaned = 0
                     zip_cleaned = 0
-                    
-                    for item in os.listdir(self.BASE_OUTPUT_FOLDER):
-                        if self.shutdown_flag.is_set():
-                            break
+                    stale_outputs = []
+                    stale_zips = []
 
-                        path = os.path.join(self.BASE_OUTPUT_FOLDER, item)
-                        if path in active_output_folders:
-                            continue
+                    with os.scandir(self.BASE_OUTPUT_FOLDER) as entries:
+                        for entry in entries:
+                            if self.shutdown_flag.is_set():
+                                break
+
+                            item = entry.name
+                            path = entry.path
+                            if path in active_output_folders:
+                                continue
 
-                        try:
-                            is_old = False
-                            # First try to parse from item name (for folders and ZIP files)
                             try:
-                                if item.startswith('result_'):
-                                    parts = item[7:].split('_')  # Remove 'result_' prefix
-                                    if len(parts) >= 2:
-                                        timestamp = parts[0] + '_' + parts[1]
-                                        folder_time = datetime.strptime(timestamp, '%Y%m%d_%H%M%S')
-                                        if current_time - folder_time > timedelta(hours=self.MAX_OUTPUT_AGE_HOURS):
-                                            is_old = True
-                                else:
-                                    # Try the old format too with session IDs
-                                    timestamp = item.split('_')[0] + '_' + item.split('_')[1]
-                                    folder_time = datetime.strptime(timestamp, '%Y%m%d_%H%M%S')
-                                    if current_time - folder_time > timedelta(hours=self.MAX_OUTPUT_AGE_HOURS):
+                                is_old = False
+                                # First try to parse from item name (for folders and ZIP files)
+                                try:
+                                    if item.startswith('result_'):
+                                        parts = item[7:].split('_')  # Remove 'result_' prefix
+                                    else:
+                                        # Try the old format too with session IDs
+                                        parts = item.split('_')
+                                    timestamp = parts[0] + '_' + parts[1]
+                                    if len(timestamp) != 15 or not (parts[0].isdigit() and parts[1].isdigit()):
+                                        raise ValueError(timestamp)
+                                    if timestamp < output_cutoff:
                                         is_old = True
-                            except (ValueError, IndexError):
-                                # If we can't parse from name, use modification time
-                                mod_time = datetime.fromtimestamp(os.path.getmtime(path))
-                                if current_time - mod_time > timedelta(hours=self.MAX_OUTPUT_AGE_HOURS):
-                                    is_old = True
-                            
-                            if is_old:
-                                if os.path.isdir(path):
-                                    shutil.rmtree(path)
-                                    output_cleaned += 1
-                                    self.logger.log_cleanup('old_output_folder', path)
-                                elif item.endswith('.zip'):
-                                    os.remove(path)
-                                    zip_cleaned += 1
-                                    self.logger.log_cleanup('old_zip', path)
+                                except (ValueError, IndexError):
+                                    # If we can't parse from name, use modification time
+                                    mod_time = datetime.fromtimestamp(entry.stat(follow_symlinks=False).st_mtime)
+                                    if current_time - mod_time > timedelta(hours=self.MAX_OUTPUT_AGE_HOURS):
+                                        is_old = True
+
+                                if is_old:
+                                    if entry.is_dir(follow_symlinks=False):
+                                        stale_outputs.append(path)
+                                    elif item.endswith('.zip'):
+                                        stale_zips.append(path)
+                            except Exception as e:
+                                self.logger.log_error(f'Error checking output {path}: {str(e)}')
+
+                    for path in stale_outputs:
+                        try:
+                            shutil.rmtree(path)
+                            output_cleaned += 1
+                            self.logger.log_cleanup('old_output_folder', path)
                         except Exception as e:
                             self.logger.log_error(f'Error cleaning output {path}: {str(e)}')
-                    
+
+                    for path in stale_zips:
+                        try:
+                            os.remove(path)
+                            zip_cleaned += 1
+                            self.logger.log_cleanup('old_zip', path)
+                        except Exception as e:
+                            self.logger.log_error(f'Error cleaning output {path}: {str(e)}')
+
                     if output_cleaned > 0 or zip_cleaned > 0:
                         self.logger.log_system(f'Cleaned up {output_cleaned} output folders and {zip_cleaned} ZIP files')
 
             except Exception as e:
                 self.logger.log_error(f'Cleanup error: {str(e)}', details=traceback.format_exc())
 
+            # Collect reference cycles once per sweep: exception tracebacks
+            # raised during task processing can keep frames (and the large
+            # arrays/uploads they reference) alive until the cycle collector
+            # runs, so tie it to this half-hourly cadence
+            gc.collect()
+
             # Sleep for 30 minutes or until shutdown (using smaller increments to allow faster shutdown)
             self.logger.log_system('Cleanup complete, next run in 30 minutes')
             for _ in range(30):  # 30 minutes in 1-minute intervals
@@ -1164,10 +1446,13 @@ class TaskHandler:
             
             # Ensure the directory exists
             os.makedirs(os.path.dirname(self.TASKS_DB_FILE), exist_ok=True)
-            
-            # Save to file with pretty formatting
-            with open(self.TASKS_DB_FILE, 'w') as f:
+
+            # Write to a temp file and rename into place, so a reader (or a
+            # crash mid-write) never sees a truncated tasks file
+            tmp_file = self.TASKS_DB_FILE + '.tmp'
+            with open(tmp_file, 'w') as f:
                 json.dump(serializable_tasks, f, indent=2)
+            os.replace(tmp_file, self.TASKS_DB_FILE)
                 
             self.logger.log_system(f"Saved {len(serializable_tasks)} tasks to {self.TASKS_DB_FILE}")
             
@@ -1198,7 +1483,15 @@ class TaskHandler:
                             task['created_at'] = datetime.fromisoformat(task['created_at'])
                         except ValueError:
                             task['created_at'] = datetime.now()
-                    
+
+                    # Normalize stored paths to absolute once at load, so
+                    # request handlers can use them without per-request
+                    # isabs/join fixups
+                    for path_key in ('zip_path', 'output_folder', 'input_folder'):
+                        path_value = task.get(path_key)
+                        if path_value and not os.path.isabs(path_value):
+                            task[path_key] = os.path.join(self.APP_ROOT, path_value)
+
                     # Add task to active_tasks
                     self.active_tasks[task_id] = task
                     
@@ -0,0 +1,14 @@
+"""WSGI entry point for production servers.
+
+Run with:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+The Flask dev server (python app.py) remains available for local debugging
+but serializes all requests; use gunicorn in deployment so uploads, status
+polls and downloads are handled on independent threads.
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run(host='127.0.0.1', port=8000, debug=False)